@@ -8,6 +8,10 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
+def which_all(cmds):
+    """Look up several executables at once, mapping each command to its path or None."""
+    return {cmd: shutil.which(cmd) for cmd in cmds}
+
 def run_health_check():
     """Check for required dependencies and print a report."""
     print("\n--- OOS Health Check ---")
@@ -18,8 +22,9 @@ def run_health_check():
         "op (1Password CLI)": "op"
     }
 
+    paths = which_all(dependencies.values())
     for name, cmd in dependencies.items():
-        if shutil.which(cmd):
+        if paths[cmd]:
             print(f"{Colors.GREEN}[OK]{Colors.END} {name}")
         else:
             print(f"{Colors.RED}[FAIL]{Colors.END} {name}")
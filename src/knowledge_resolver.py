@@ -3,14 +3,18 @@ Knowledge Resolver for OOS
 Integrates multiple documentation sources to provide normalized answers
 """
 
+import asyncio
 import os
+import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import date
+from typing import Protocol
 
-import requests
+import httpx
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     """Information about a knowledge source"""
     url: str
@@ -19,7 +23,7 @@ class SourceInfo:
     source_type: str  # "docs", "web", "api"
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaInfo:
     """Information about service quotas/limits"""
     name: str
@@ -28,7 +32,7 @@ class QuotaInfo:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeResult:
     """Normalized knowledge query result"""
     capabilities: list[str]
@@ -42,6 +46,14 @@ class KnowledgeResult:
     confidence: float
 
 
+class KnowledgeAdapter(Protocol):
+    """Interface the resolver expects from each knowledge source adapter"""
+
+    async def is_available(self) -> bool: ...
+
+    async def query(self, query: str, domain: str) -> KnowledgeResult | None: ...
+
+
 class KnowledgeResolver:
     """
     Resolves knowledge queries using multiple adapters:
@@ -51,26 +63,55 @@ class KnowledgeResolver:
     """
 
     def __init__(self):
-        self.adapters = {
+        self.adapters: dict[str, KnowledgeAdapter] = {
             'context7': Context7Adapter(),
             'docs_mcp': DocsMCPAdapter(),
             'deep_research': DeepResearchAdapter()
         }
+        # Preference order; adapters stay in the dict so they can be swapped by name
+        self._order = ('context7', 'docs_mcp', 'deep_research')
         self.timeout = int(os.getenv('KNOWLEDGE_TIMEOUT', '30'))
+        # First result above this confidence is returned without trying later adapters
+        self.early_exit_threshold = 0.5
+        # LRU of accepted results keyed on (query, domain)
+        self._cache: OrderedDict[tuple[str, str], KnowledgeResult] = OrderedDict()
+        self._cache_size = 256
+        # Adapter name -> (monotonic time checked, available)
+        self._avail_cache: dict[str, tuple[float, bool]] = {}
+        self.availability_ttl = 30.0
 
     async def resolve_query(self, query: str, domain: str) -> KnowledgeResult:
         """
         Resolve a knowledge query using available adapters
         Tries adapters in order until one returns a result
         """
-        # Try adapters in order of preference
-        for adapter_name in ['context7', 'docs_mcp', 'deep_research']:
+        key = (query, domain)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        adapters = [(name, self.adapters[name]) for name in self._order]
+
+        # Probe every adapter at once; only the queries run in order of preference
+        availability = await asyncio.gather(
+            *(self._is_available(name, adapter) for name, adapter in adapters),
+            return_exceptions=True
+        )
+
+        for (adapter_name, adapter), available in zip(adapters, availability,
+                                                      strict=True):
+            if isinstance(available, Exception):
+                print(f"Adapter {adapter_name} failed: {available}")
+                continue
+            if not available:
+                continue
             try:
-                adapter = self.adapters[adapter_name]
-                if await adapter.is_available():
-                    result = await adapter.query(query, domain)
-                    if result and result.confidence > 0.5:
-                        return result
+                result = await adapter.query(query, domain)
+                if result and result.confidence > self.early_exit_threshold:
+                    self._cache[key] = result
+                    if len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+                    return result
             except Exception as e:
                 print(f"Adapter {adapter_name} failed: {e}")
                 continue
@@ -88,6 +129,16 @@ class KnowledgeResolver:
             confidence=0.0
         )
 
+    async def _is_available(self, name: str, adapter: KnowledgeAdapter) -> bool:
+        """Check adapter health, reusing the answer for availability_ttl seconds"""
+        now = time.monotonic()
+        cached = self._avail_cache.get(name)
+        if cached and now - cached[0] < self.availability_ttl:
+            return cached[1]
+        available = await adapter.is_available()
+        self._avail_cache[name] = (now, available)
+        return available
+
 
 class Context7Adapter:
     """Adapter for Context7 (official documentation)"""
@@ -95,11 +146,15 @@ class Context7Adapter:
     def __init__(self):
         self.base_url = os.getenv('CONTEXT7_URL', 'http://localhost:8080')
         self.api_key = os.getenv('CONTEXT7_API_KEY')
+        self.timeout = int(os.getenv('KNOWLEDGE_TIMEOUT', '30'))
 
     async def is_available(self) -> bool:
         """Check if Context7 is available"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            # A client per call: callers such as resolve_knowledge() each run in a
+            # fresh asyncio.run(), and a pooled client cannot outlive its event loop
+            async with httpx.AsyncClient(timeout=min(5, self.timeout)) as client:
+                response = await client.get(f"{self.base_url}/health")
             return response.status_code == 200
         except:
             return False
@@ -107,32 +162,31 @@ class Context7Adapter:
     async def query(self, query: str, domain: str) -> KnowledgeResult | None:
         """Query Context7 for documentation"""
         try:
-            # Try to resolve library URI first
-            library_response = requests.post(
-                f"{self.base_url}/resolve-library-uri",
-                json={"libraryName": query.split()[0] if query.split() else query},
-                timeout=self.timeout
-            )
-
-            if library_response.status_code != 200:
-                return None
-
-            library_data = library_response.json()
-            resource_uri = library_data.get('resourceUri')
-
-            if not resource_uri:
-                return None
-
-            # Search documentation
-            docs_response = requests.post(
-                f"{self.base_url}/search-library-docs",
-                json={
-                    "resourceURI": resource_uri,
-                    "topic": query,
-                    "tokens": 5000
-                },
-                timeout=self.timeout
-            )
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                # Try to resolve library URI first
+                library_response = await client.post(
+                    f"{self.base_url}/resolve-library-uri",
+                    json={"libraryName": query.split()[0] if query.split() else query}
+                )
+
+                if library_response.status_code != 200:
+                    return None
+
+                library_data = library_response.json()
+                resource_uri = library_data.get('resourceUri')
+
+                if not resource_uri:
+                    return None
+
+                # Search documentation
+                docs_response = await client.post(
+                    f"{self.base_url}/search-library-docs",
+                    json={
+                        "resourceURI": resource_uri,
+                        "topic": query,
+                        "tokens": 5000
+                    }
+                )
 
             if docs_response.status_code != 200:
                 return None
@@ -190,11 +244,13 @@ class DocsMCPAdapter:
 
     def __init__(self):
         self.server_url = os.getenv('DOCS_MCP_URL', 'http://localhost:8001')
+        self.timeout = int(os.getenv('KNOWLEDGE_TIMEOUT', '30'))
 
     async def is_available(self) -> bool:
         """Check if Docs MCP is available"""
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=5)
+            async with httpx.AsyncClient(timeout=min(5, self.timeout)) as client:
+                response = await client.get(f"{self.server_url}/health")
             return response.status_code == 200
         except:
             return False
@@ -202,15 +258,15 @@ class DocsMCPAdapter:
     async def query(self, query: str, domain: str) -> KnowledgeResult | None:
         """Query Docs MCP for documentation"""
         try:
-            response = requests.post(
-                f"{self.server_url}/search",
-                json={
-                    "query": query,
-                    "domain": domain,
-                    "limit": 10
-                },
-                timeout=self.timeout
-            )
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(
+                    f"{self.server_url}/search",
+                    json={
+                        "query": query,
+                        "domain": domain,
+                        "limit": 10
+                    }
+                )
 
             if response.status_code != 200:
                 return None
@@ -267,11 +323,13 @@ class DeepResearchAdapter:
 
     def __init__(self):
         self.server_url = os.getenv('DEEP_RESEARCH_MCP_URL', 'http://localhost:8002')
+        self.timeout = int(os.getenv('KNOWLEDGE_TIMEOUT', '30'))
 
     async def is_available(self) -> bool:
         """Check if Deep-Research MCP is available"""
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=5)
+            async with httpx.AsyncClient(timeout=min(5, self.timeout)) as client:
+                response = await client.get(f"{self.server_url}/health")
             return response.status_code == 200
         except:
             return False
@@ -279,15 +337,15 @@ class DeepResearchAdapter:
     async def query(self, query: str, domain: str) -> KnowledgeResult | None:
         """Query Deep-Research MCP for web research"""
         try:
-            response = requests.post(
-                f"{self.server_url}/research",
-                json={
-                    "query": query,
-                    "domain": domain,
-                    "max_sources": 5
-                },
-                timeout=self.timeout
-            )
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(
+                    f"{self.server_url}/research",
+                    json={
+                        "query": query,
+                        "domain": domain,
+                        "max_sources": 5
+                    }
+                )
 
             if response.status_code != 200:
                 return None
@@ -353,17 +411,11 @@ async def resolve_knowledge(query: str, domain: str) -> KnowledgeResult:
 
 def result_to_dict(result: KnowledgeResult) -> dict:
     """Convert KnowledgeResult to dictionary for JSON serialization"""
-    data = asdict(result)
-    # Convert SourceInfo objects to dicts
-    data['sources'] = [asdict(source) for source in result.sources]
-    # Convert QuotaInfo objects to dicts
-    data['quotas'] = [asdict(quota) for quota in result.quotas]
-    return data
+    # asdict recurses into the SourceInfo and QuotaInfo lists already
+    return asdict(result)
 
 
 if __name__ == "__main__":
-    import asyncio
-
     async def test_resolver():
         query = "What capabilities does ChatGPT Plus offer?"
         domain = "account/plan"
@@ -7,10 +7,15 @@ workflow execution, and system performance.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+import operator
 import sqlite3
+import sys
+import threading
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -20,6 +25,44 @@ import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize with the stdlib in the same compact UTF-8 form orjson writes"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# orjson is optional; it serializes the per-row parameters/context much faster.
+# Both backends store the same text and reject the same types (datetimes,
+# dataclasses); the one difference is that orjson stores non-finite floats
+# as null where json writes NaN/Infinity.
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                       | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+except ImportError:
+    _dumps = _json_dumps
+
+_INSERT_USAGE_SQL = '''
+    INSERT INTO learning_data
+    (timestamp, user_id, session_id, command_name, parameters,
+     execution_time, success, error_message, context)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Memory-mapped I/O window for the learning database; smaller on Windows,
+# where a mapped file cannot be truncated
+_MMAP_SIZE = (64 if sys.platform == "win32" else 256) * 1024 * 1024
+
+# LearningData fields in _INSERT_USAGE_SQL column order
+_USAGE_FIELDS = operator.attrgetter(
+    'timestamp', 'user_id', 'session_id', 'command_name', 'parameters',
+    'execution_time', 'success', 'error_message', 'context'
+)
+
+
 @dataclass
 class UsagePattern:
     """Represents a usage pattern from command execution"""
@@ -32,7 +75,7 @@ class UsagePattern:
     context: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LearningData:
     """Learning data point from system usage"""
     timestamp: datetime
@@ -66,6 +109,11 @@ class LearningSystem:
         self.db_path = db_path or str(Path.home() / ".oos" / "learning.db")
         self.logger = self._setup_logger()
 
+        # One long-lived connection, opened lazily by _get_conn() and shared
+        # across threads; _conn_lock serializes every transaction on it
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.RLock()
+
         # Initialize database
         self._init_database()
 
@@ -78,6 +126,9 @@ class LearningSystem:
         self.patterns = []
         self.suggestions = []
         self.last_learning_update = datetime.now()
+        # learn_patterns output keyed on (row count, max rowid, data_version) of
+        # the data it read plus the frequency threshold; record_usage clears it
+        self._patterns_cache: dict[tuple[int, int, int, int], list[UsagePattern]] = {}
 
     def _default_config(self) -> dict[str, Any]:
         """Default configuration for learning system"""
@@ -106,11 +157,40 @@ class LearningSystem:
 
         return logger
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the shared database connection, opening it on first use"""
+        with self._conn_lock:
+            if self._conn is None:
+                # Every query is a constant parameterized string, so a larger
+                # statement cache lets each one be prepared only once
+                conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                       cached_statements=256)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+                conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+                self._conn = conn
+            return self._conn
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection lock for one transaction on the shared connection"""
+        with self._conn_lock, self._get_conn() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close the shared database connection"""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _init_database(self):
         """Initialize SQLite database for learning data"""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             # Create tables
@@ -166,31 +246,46 @@ class LearningSystem:
             return
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute(_INSERT_USAGE_SQL, self._usage_row(learning_data))
+                conn.commit()
+            self._patterns_cache.clear()
 
-                cursor.execute('''
-                    INSERT INTO learning_data
-                    (timestamp, user_id, session_id, command_name, parameters,
-                     execution_time, success, error_message, context)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    learning_data.timestamp.isoformat(),
-                    learning_data.user_id,
-                    learning_data.session_id,
-                    learning_data.command_name,
-                    json.dumps(learning_data.parameters),
-                    learning_data.execution_time,
-                    learning_data.success,
-                    learning_data.error_message,
-                    json.dumps(learning_data.context)
-                ))
+        except Exception as e:
+            self.logger.error(f"Failed to record usage data: {e}")
 
+    def record_usage_many(self, data_list: Iterable[LearningData]) -> None:
+        """Record several usage data points in a single transaction"""
+        if not self.config["learning_enabled"]:
+            return
+
+        try:
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(_INSERT_USAGE_SQL, map(self._usage_row, data_list))
                 conn.commit()
+            self._patterns_cache.clear()
 
         except Exception as e:
             self.logger.error(f"Failed to record usage data: {e}")
 
+    def _usage_row(self, learning_data: LearningData) -> tuple:
+        """Build the learning_data INSERT parameters for a data point"""
+        (timestamp, user_id, session_id, command_name, parameters,
+         execution_time, success, error_message, context) = _USAGE_FIELDS(learning_data)
+        return (
+            timestamp.isoformat(),
+            user_id,
+            session_id,
+            command_name,
+            _dumps(parameters),
+            execution_time,
+            success,
+            error_message,
+            _dumps(context)
+        )
+
     async def learn_patterns(self) -> list[UsagePattern]:
         """Learn patterns from usage data"""
         if not self.config["learning_enabled"]:
@@ -205,9 +300,24 @@ class LearningSystem:
             # Get recent usage data
             cutoff_date = datetime.now() - timedelta(days=self.config["retention_days"])
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
+                # Same rows and threshold as last time: skip the scan and the
+                # mining. data_version changes whenever another connection
+                # commits, which catches in-place UPDATEs made elsewhere
+                cursor.execute('''
+                    SELECT COUNT(*), COALESCE(MAX(rowid), 0),
+                           (SELECT data_version FROM pragma_data_version())
+                    FROM learning_data
+                    WHERE timestamp > ?
+                ''', (cutoff_date.isoformat(),))
+                signature = (*cursor.fetchone(), self.config["min_pattern_frequency"])
+                if signature in self._patterns_cache:
+                    self.patterns = self._patterns_cache[signature]
+                    self.last_learning_update = datetime.now()
+                    return self.patterns
+
                 cursor.execute('''
                     SELECT * FROM learning_data
                     WHERE timestamp > ?
@@ -219,14 +329,13 @@ class LearningSystem:
             if not usage_data:
                 return []
 
-            # Learn command sequences
-            command_sequences = self._learn_command_sequences(usage_data)
-
-            # Learn parameter patterns
-            parameter_patterns = self._learn_parameter_patterns(usage_data)
-
-            # Learn workflow patterns
-            workflow_patterns = self._learn_workflow_patterns(usage_data)
+            # Mine command sequences, parameter patterns and workflow patterns
+            # in worker threads so the event loop stays free
+            command_sequences, parameter_patterns, workflow_patterns = await asyncio.gather(
+                asyncio.to_thread(self._learn_command_sequences, usage_data),
+                asyncio.to_thread(self._learn_parameter_patterns, usage_data),
+                asyncio.to_thread(self._learn_workflow_patterns, usage_data)
+            )
 
             # Combine all patterns
             all_patterns = command_sequences + parameter_patterns + workflow_patterns
@@ -240,6 +349,7 @@ class LearningSystem:
             # Save patterns
             self._save_patterns(filtered_patterns)
             self.patterns = filtered_patterns
+            self._patterns_cache = {signature: filtered_patterns}
 
             # Update last learning time
             self.last_learning_update = datetime.now()
@@ -254,54 +364,53 @@ class LearningSystem:
 
     def _learn_command_sequences(self, usage_data: list) -> list[UsagePattern]:
         """Learn command sequences from usage data"""
-        sequences = defaultdict(list)
+        sequences = Counter()
         pattern_id = 0
 
         # Group by session to get sequences
         session_commands = defaultdict(list)
         for record in usage_data:
-            session_commands[record[3]].append({  # session_id is index 3
-                'command': record[4],  # command_name
-                'success': record[7],  # success
-                'timestamp': record[1]  # timestamp
-            })
+            # (timestamp, command_name, success); session_id is index 3
+            session_commands[record[3]].append((record[1], record[4], record[7]))
 
         # Find sequences
-        for _session_id, commands in session_commands.items():
+        for commands in session_commands.values():
             if len(commands) < 2:
                 continue
 
             # Sort by timestamp
-            commands.sort(key=lambda x: x['timestamp'])
+            commands.sort(key=lambda x: x[0])
+            names = [cmd[1] for cmd in commands]
 
-            # Extract sequences of 2-5 commands
-            for seq_len in range(2, min(6, len(commands) + 1)):
-                for i in range(len(commands) - seq_len + 1):
-                    sequence = commands[i:i + seq_len]
+            # failures[i] counts failed commands before position i, so a window
+            # is all-successful exactly when both ends see the same count
+            failures = [0]
+            for cmd in commands:
+                failures.append(failures[-1] + (not cmd[2]))
 
-                    # Only consider successful sequences
-                    if all(cmd['success'] for cmd in sequence):
-                        sequence_key = ' -> '.join(cmd['command'] for cmd in sequence)
-                        sequences[sequence_key].append(sequence)
+            # Count successful sequences of 2-5 commands
+            for seq_len in range(2, min(6, len(names) + 1)):
+                for i in range(len(names) - seq_len + 1):
+                    if failures[i + seq_len] == failures[i]:
+                        sequences[tuple(names[i:i + seq_len])] += 1
+
+        session_count = len({record[3] for record in usage_data})
 
         # Create pattern objects
         patterns = []
-        for sequence_key, occurrences in sequences.items():
-            if len(occurrences) >= self.config["min_pattern_frequency"]:
-                success_count = sum(1 for seq in occurrences if all(cmd['success'] for cmd in seq))
-                success_rate = success_count / len(occurrences)
-
+        for sequence, frequency in sequences.items():
+            if frequency >= self.config["min_pattern_frequency"]:
                 pattern = UsagePattern(
                     pattern_id=f"seq_{pattern_id}",
                     pattern_type="command_sequence",
                     pattern_data={
-                        "sequence": [cmd['command'] for cmd in occurrences[0]],
-                        "length": len(occurrences[0])
+                        "sequence": list(sequence),
+                        "length": len(sequence)
                     },
-                    frequency=len(occurrences),
-                    success_rate=success_rate,
+                    frequency=frequency,
+                    success_rate=1.0,  # only all-successful sequences are counted
                     last_used=datetime.now(),
-                    context={"session_count": len({seq[3] for seq in usage_data})}
+                    context={"session_count": session_count}
                 )
                 patterns.append(pattern)
                 pattern_id += 1
@@ -394,7 +503,7 @@ class LearningSystem:
 
     def _save_patterns(self, patterns: list[UsagePattern]):
         """Save learned patterns to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             for pattern in patterns:
@@ -416,6 +525,9 @@ class LearningSystem:
 
     async def generate_suggestions(self) -> list[ImprovementSuggestion]:
         """Generate improvement suggestions based on patterns"""
+        if not self.config["learning_enabled"]:
+            return []
+
         suggestions = []
 
         # Analyze patterns for improvement opportunities
@@ -545,7 +657,7 @@ class LearningSystem:
 
     def _save_suggestions(self, suggestions: list[ImprovementSuggestion]):
         """Save suggestions to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             for suggestion in suggestions:
@@ -629,7 +741,7 @@ class LearningSystem:
         suggestions = []
 
         # Analyze workspace-specific patterns
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute('''
@@ -655,16 +767,12 @@ class LearningSystem:
 
     def get_usage_statistics(self) -> dict[str, Any]:
         """Get usage statistics and insights"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
-            # Total usage
-            cursor.execute("SELECT COUNT(*) FROM learning_data")
-            total_usage = cursor.fetchone()[0]
-
-            # Success rate
-            cursor.execute("SELECT COUNT(*) FROM learning_data WHERE success = 1")
-            successful_usage = cursor.fetchone()[0]
+            # Total and successful usage in one scan
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(success = 1), 0) FROM learning_data")
+            total_usage, successful_usage = cursor.fetchone()
 
             # Popular commands
             cursor.execute('''
@@ -702,7 +810,7 @@ class LearningSystem:
     def implement_suggestion(self, suggestion_id: str) -> bool:
         """Mark a suggestion as implemented"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
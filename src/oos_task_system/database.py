@@ -5,14 +5,25 @@ Provides TaskDatabase class with CRUD operations, dependency tracking,
 and database schema management.
 """
 
+import copy
+import dataclasses
 import json
 import sqlite3
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .models import Task, TaskPriority, TaskStatus
 
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks (
+        id, title, description, status, priority, tags, assignee,
+        created_at, updated_at, completed_at, due_date,
+        estimated_hours, actual_hours, context
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class TaskDatabase:
     """
@@ -22,19 +33,41 @@ class TaskDatabase:
     CRUD operations, and dependency queries.
     """
 
-    def __init__(self, db_path: str):
-        """Initialize database connection and ensure schema exists."""
+    def __init__(self, db_path: str, now_fn: Callable[[], datetime] = datetime.now):
+        """Initialize database connection and ensure schema exists.
+
+        Pass ``":memory:"`` for a private in-memory database; it keeps a single
+        connection open for the lifetime of this object. ``now_fn`` supplies
+        the ``updated_at`` timestamps written by ``update_task``.
+        """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.now_fn = now_fn
+        self._memory_conn: sqlite3.Connection | None = None
+        # list_tasks results keyed by filters; cleared on every write
+        self._list_cache: dict[tuple, list[Task]] = {}
+        if db_path == ":memory:":
+            self._memory_conn = self._connect()
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with proper settings."""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with proper settings."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row  # Enable dict-like access
         conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
         return conn
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection with proper settings."""
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return self._connect()
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached query results after a write."""
+        self._list_cache.clear()
+
     def _init_schema(self) -> None:
         """Initialize database schema."""
         with self._get_connection() as conn:
@@ -77,23 +110,9 @@ class TaskDatabase:
 
     def create_task(self, task: Task) -> Task:
         """Create a new task in the database."""
+        self._invalidate_cache()
         with self._get_connection() as conn:
-            conn.execute("""
-                INSERT INTO tasks (
-                    id, title, description, status, priority, tags, assignee,
-                    created_at, updated_at, completed_at, due_date,
-                    estimated_hours, actual_hours, context
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task.id, task.title, task.description,
-                task.status.value, task.priority.value,
-                json.dumps(task.tags), task.assignee,
-                task.created_at.isoformat(), task.updated_at.isoformat(),
-                task.completed_at.isoformat() if task.completed_at else None,
-                task.due_date.isoformat() if task.due_date else None,
-                task.estimated_hours, task.actual_hours,
-                json.dumps(task.context)
-            ))
+            conn.execute(_INSERT_TASK_SQL, self._task_params(task))
 
             # Insert dependencies
             for dep_id in task.depends_on:
@@ -101,6 +120,32 @@ class TaskDatabase:
 
         return task
 
+    def create_tasks_bulk(self, tasks: list[Task]) -> list[Task]:
+        """Create several tasks in one transaction with a single executemany."""
+        self._invalidate_cache()
+        with self._get_connection() as conn:
+            conn.executemany(_INSERT_TASK_SQL, [self._task_params(task) for task in tasks])
+
+            # Dependencies go in after every task row exists
+            for task in tasks:
+                for dep_id in task.depends_on:
+                    self._add_dependency(conn, task.id, dep_id)
+
+        return tasks
+
+    def _task_params(self, task: Task) -> tuple:
+        """Build the INSERT parameters for a task row."""
+        return (
+            task.id, task.title, task.description,
+            task.status.value, task.priority.value,
+            json.dumps(task.tags), task.assignee,
+            task.created_at.isoformat(), task.updated_at.isoformat(),
+            task.completed_at.isoformat() if task.completed_at else None,
+            task.due_date.isoformat() if task.due_date else None,
+            task.estimated_hours, task.actual_hours,
+            json.dumps(task.context)
+        )
+
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
         with self._get_connection() as conn:
@@ -126,7 +171,8 @@ class TaskDatabase:
 
     def update_task(self, task: Task) -> Task:
         """Update an existing task."""
-        task.updated_at = datetime.now()
+        task.updated_at = self.now_fn()
+        self._invalidate_cache()
 
         with self._get_connection() as conn:
             conn.execute("""
@@ -153,6 +199,7 @@ class TaskDatabase:
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID."""
+        self._invalidate_cache()
         with self._get_connection() as conn:
             cursor = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
             return cursor.rowcount > 0
@@ -160,7 +207,16 @@ class TaskDatabase:
     def list_tasks(self, status: TaskStatus | None = None,
                    assignee: str | None = None,
                    tags: list[str] | None = None) -> list[Task]:
-        """List tasks with optional filtering."""
+        """List tasks with optional filtering.
+
+        In-memory databases cache the result until the next write through this
+        object and hand out copies, so callers may mutate what they get back.
+        File databases can be written by other connections and always query.
+        """
+        cache_key = (status, assignee, tuple(tags) if tags else None)
+        if self._memory_conn is not None and cache_key in self._list_cache:
+            return [self._copy_task(task) for task in self._list_cache[cache_key]]
+
         query = "SELECT * FROM tasks"
         params = []
         conditions = []
@@ -205,8 +261,22 @@ class TaskDatabase:
 
                 tasks.append(task)
 
+        if self._memory_conn is not None:
+            self._list_cache[cache_key] = tasks
+            return [self._copy_task(task) for task in tasks]
         return tasks
 
+    @staticmethod
+    def _copy_task(task: Task) -> Task:
+        """Copy a cached task, including its lists and context, so the cache stays intact."""
+        return dataclasses.replace(
+            task,
+            tags=list(task.tags),
+            depends_on=list(task.depends_on),
+            blocks=list(task.blocks),
+            context=copy.deepcopy(task.context),
+        )
+
     def get_ready_tasks(self) -> list[Task]:
         """Get tasks that are ready to work on (no pending dependencies)."""
         with self._get_connection() as conn:
@@ -286,11 +356,13 @@ class TaskDatabase:
 
     def add_dependency(self, task_id: str, depends_on_id: str) -> bool:
         """Add a dependency between tasks."""
+        self._invalidate_cache()
         with self._get_connection() as conn:
             return self._add_dependency(conn, task_id, depends_on_id)
 
     def remove_dependency(self, task_id: str, depends_on_id: str) -> bool:
         """Remove a dependency between tasks."""
+        self._invalidate_cache()
         with self._get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM task_dependencies WHERE task_id = ? AND depends_on_id = ?",
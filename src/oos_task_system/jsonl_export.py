@@ -7,14 +7,21 @@ and incremental export capabilities.
 
 import gzip
 import json
+import os
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from .database import TaskDatabase
 from .models import Task, TaskStatus
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 
 class ExportError(Exception):
     """Raised when export operations fail."""
@@ -183,19 +190,22 @@ class TaskExporter:
 
         return export_summary
 
-    def _export_tasks(self, tasks: list[Task], output_path: str, **options) -> dict[str, Any]:
+    def export_to_stream(self, stream: TextIO, tasks: list[Task] | None = None,
+                         **options) -> dict[str, Any]:
         """
-        Internal method to export task list to JSONL.
+        Export tasks as JSONL to an open text stream.
 
         Args:
-            tasks: List of tasks to export
-            output_path: Output file path
-            **options: Export options
+            stream: Writable text stream (file handle, io.StringIO, ...)
+            tasks: Tasks to export (default: all tasks in the database)
+            **options: Export options (include_metadata, sort_by, etc.)
 
         Returns:
-            Export summary
+            Export summary with statistics
         """
-        compress = options.get('compress', False)
+        if tasks is None:
+            tasks = self.database.list_tasks()
+
         include_metadata = options.get('include_metadata', True)
         sort_by = options.get('sort_by', 'created_at')
         reverse_sort = options.get('reverse_sort', False)
@@ -208,7 +218,7 @@ class TaskExporter:
             'total_tasks': len(tasks),
             'exported_tasks': len(tasks),
             'format_options': {
-                'compress': compress,
+                'compress': options.get('compress', False),
                 'include_metadata': include_metadata,
                 'sort_by': sort_by,
                 'reverse_sort': reverse_sort,
@@ -217,30 +227,57 @@ class TaskExporter:
             }
         })
 
-        try:
-            # Sort tasks if requested
-            if sort_by:
-                tasks = self._sort_tasks(tasks, sort_by, reverse_sort)
+        # Sort tasks if requested
+        if sort_by:
+            tasks = self._sort_tasks(tasks, sort_by, reverse_sort)
+
+        self._write_tasks_to_file(stream, tasks, include_metadata, exclude_fields, pretty_format)
+
+        return {
+            'success': True,
+            'exported_tasks': len(tasks),
+            'metadata': self.export_metadata.copy()
+        }
+
+    def _export_tasks(self, tasks: list[Task], output_path: str, **options) -> dict[str, Any]:
+        """
+        Internal method to export task list to JSONL.
 
+        Args:
+            tasks: List of tasks to export
+            output_path: Output file path
+            **options: Export options; ``compress`` is False, True/'gzip' or 'zstd'
+
+        Returns:
+            Export summary
+        """
+        compress = options.get('compress', False)
+
+        try:
             # Prepare output file
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Write tasks
-            if compress:
+            if compress == 'zstd':
+                if not ZSTD_AVAILABLE:
+                    raise ExportError("zstd compression requires the 'zstandard' package")
+                with zstandard.open(output_file, 'wt', encoding='utf-8') as f:
+                    summary = self.export_to_stream(f, tasks, **options)
+            elif compress:
                 with gzip.open(output_file, 'wt', encoding='utf-8') as f:
-                    self._write_tasks_to_file(f, tasks, include_metadata, exclude_fields, pretty_format)
+                    summary = self.export_to_stream(f, tasks, **options)
             else:
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    self._write_tasks_to_file(f, tasks, include_metadata, exclude_fields, pretty_format)
+                    summary = self.export_to_stream(f, tasks, **options)
 
             return {
                 'success': True,
                 'output_path': str(output_file),
-                'exported_tasks': len(tasks),
+                'exported_tasks': summary['exported_tasks'],
                 'file_size_bytes': output_file.stat().st_size,
-                'compressed': compress,
-                'metadata': self.export_metadata.copy()
+                'compressed': bool(compress),
+                'metadata': summary['metadata']
             }
 
         except Exception as e:
@@ -340,7 +377,10 @@ class TaskExporter:
 
     def get_export_formats(self) -> list[str]:
         """Get list of supported export formats."""
-        return ['jsonl', 'jsonl.gz']
+        formats = ['jsonl', 'jsonl.gz']
+        if ZSTD_AVAILABLE:
+            formats.append('jsonl.zst')
+        return formats
 
     def validate_export_path(self, path: str) -> tuple[bool, str]:
         """
@@ -367,7 +407,6 @@ class TaskExporter:
                     return False, "No write permission for existing file"
             else:
                 # Check parent directory write permission
-                import os
                 if not os.access(output_path.parent, os.W_OK):
                     return False, "No write permission for directory"
 
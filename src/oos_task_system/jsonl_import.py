@@ -10,12 +10,18 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from .database import TaskDatabase
 from .models import Task, TaskPriority, TaskStatus
 from .validation import TaskValidator
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 
 class ImportError(Exception):
     """Raised when import operations fail."""
@@ -89,22 +95,57 @@ class TaskImporter:
         start_time = datetime.now()
 
         try:
-            tasks = self._read_jsonl_file(input_path)
+            stream = self._open_jsonl_file(input_path)
+        except Exception as e:
+            return self._read_failure(f"Failed to read file: {str(e)}", start_time)
+
+        with stream:
+            return self.import_from_stream(stream, conflict_resolution, dry_run,
+                                           validate, strict_validation, import_metadata)
+
+    def import_from_stream(self, stream: IO,
+                          conflict_resolution: str = ConflictResolution.SKIP,
+                          dry_run: bool = False,
+                          validate: bool = True,
+                          strict_validation: bool = False,
+                          import_metadata: dict[str, Any] | None = None) -> ImportResult:
+        """
+        Import tasks from an open JSONL stream.
+
+        Args:
+            stream: Readable text or binary stream, e.g. ``gzip.open(path, 'rb')``
+            conflict_resolution: How to handle conflicts with existing tasks
+            dry_run: Preview import without making changes
+            validate: Validate tasks before importing
+            strict_validation: Use strict validation rules
+            import_metadata: Optional metadata to add to imported tasks
+
+        Returns:
+            ImportResult with detailed statistics
+        """
+        start_time = datetime.now()
+
+        try:
+            tasks = self._read_jsonl_stream(stream)
             return self._process_import(tasks, conflict_resolution, dry_run,
                                       validate, strict_validation, import_metadata, start_time)
         except Exception as e:
-            return ImportResult(
-                success=False,
-                total_processed=0,
-                tasks_imported=0,
-                tasks_updated=0,
-                tasks_skipped=0,
-                tasks_failed=0,
-                errors=[f"Failed to read file: {str(e)}"],
-                warnings=[],
-                processing_time=(datetime.now() - start_time).total_seconds(),
-                metadata={}
-            )
+            return self._read_failure(f"Failed to read stream: {str(e)}", start_time)
+
+    def _read_failure(self, error: str, start_time: datetime) -> ImportResult:
+        """Build the result for an import whose input could not be read."""
+        return ImportResult(
+            success=False,
+            total_processed=0,
+            tasks_imported=0,
+            tasks_updated=0,
+            tasks_skipped=0,
+            tasks_failed=0,
+            errors=[error],
+            warnings=[],
+            processing_time=(datetime.now() - start_time).total_seconds(),
+            metadata={}
+        )
 
     def import_incremental(self, input_path: str,
                           since: datetime,
@@ -208,9 +249,8 @@ class TaskImporter:
                                   kwargs.get('strict_validation', False),
                                   kwargs.get('import_metadata'), start_time)
 
-    def _read_jsonl_file(self, input_path: str) -> list[Task]:
-        """Read tasks from JSONL file."""
-        tasks = []
+    def _open_jsonl_file(self, input_path: str) -> IO:
+        """Open a JSONL file as text, decompressing .gz and .zst by suffix."""
         file_path = Path(input_path)
 
         if not file_path.exists():
@@ -218,39 +258,61 @@ class TaskImporter:
 
         try:
             # Determine if file is compressed
-            open_func = gzip.open if input_path.endswith('.gz') else open
+            if input_path.endswith('.zst'):
+                if not ZSTD_AVAILABLE:
+                    raise ImportError("Reading .zst files requires the 'zstandard' package")
+                open_func = zstandard.open
+            elif input_path.endswith('.gz'):
+                open_func = gzip.open
+            else:
+                open_func = open
 
-            with open_func(input_path, 'rt', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
+            return open_func(input_path, 'rt', encoding='utf-8')
 
-                    try:
-                        data = json.loads(line)
+        except Exception as e:
+            raise ImportError(f"Failed to read file {input_path}: {str(e)}") from e
 
-                        # Skip metadata lines
-                        if '__metadata__' in data:
-                            continue
+    def _read_jsonl_file(self, input_path: str) -> list[Task]:
+        """Read tasks from JSONL file."""
+        stream = self._open_jsonl_file(input_path)
 
-                        # Parse task (remove export metadata if present)
-                        task_data = data.copy()
-                        task_data.pop('__exported_at__', None)
+        try:
+            with stream:
+                return self._read_jsonl_stream(stream)
+        except Exception as e:
+            raise ImportError(f"Failed to read file {input_path}: {str(e)}") from e
 
-                        task = self._parse_task_data(task_data)
-                        tasks.append(task)
+    def _read_jsonl_stream(self, stream: IO) -> list[Task]:
+        """Read tasks from an open JSONL stream (text or bytes lines)."""
+        tasks = []
 
-                    except json.JSONDecodeError as e:
-                        self.import_stats['errors'].append(
-                            f"Line {line_num}: Invalid JSON: {str(e)}"
-                        )
-                    except Exception as e:
-                        self.import_stats['errors'].append(
-                            f"Line {line_num}: Task parsing failed: {str(e)}"
-                        )
+        for line_num, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
 
-        except Exception as e:
-            raise ImportError(f"Failed to read file {input_path}: {str(e)}")
+            try:
+                data = json.loads(line)
+
+                # Skip metadata lines
+                if '__metadata__' in data:
+                    continue
+
+                # Parse task (remove export metadata if present)
+                task_data = data.copy()
+                task_data.pop('__exported_at__', None)
+
+                task = self._parse_task_data(task_data)
+                tasks.append(task)
+
+            except json.JSONDecodeError as e:
+                self.import_stats['errors'].append(
+                    f"Line {line_num}: Invalid JSON: {str(e)}"
+                )
+            except Exception as e:
+                self.import_stats['errors'].append(
+                    f"Line {line_num}: Task parsing failed: {str(e)}"
+                )
 
         return tasks
 
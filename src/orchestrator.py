@@ -9,6 +9,7 @@ parameter passing, error handling, and parallel execution capabilities.
 import asyncio
 import json
 import logging
+import re
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,9 @@ from typing import Any
 
 import yaml
 
+# Matches ``${variable}`` placeholders in workflow step parameters
+_VAR_RE = re.compile(r"\$\{(\w+)\}")
+
 
 class ExecutionStatus(Enum):
     """Execution status enumeration"""
@@ -320,13 +324,7 @@ class WorkflowOrchestrator:
 
         for key, value in parameters.items():
             if isinstance(value, str):
-                # Variable substitution
-                if value.startswith('${') and value.endswith('}'):
-                    var_name = value[2:-1]
-                    resolved[key] = context.variables.get(var_name,
-                                     context.previous_results.get(var_name, value))
-                else:
-                    resolved[key] = value
+                resolved[key] = self._substitute_variables(value, context)
             elif isinstance(value, dict):
                 resolved[key] = self._resolve_parameters(value, context)
             elif isinstance(value, list):
@@ -339,6 +337,22 @@ class WorkflowOrchestrator:
 
         return resolved
 
+    def _substitute_variables(self, value: str, context: WorkflowContext) -> Any:
+        """Substitute ``${variable}`` placeholders in a parameter string"""
+        if '${' not in value:
+            return value
+
+        def lookup(var_name: str, default: Any) -> Any:
+            return context.variables.get(var_name,
+                                         context.previous_results.get(var_name, default))
+
+        # A lone placeholder keeps the variable's original type
+        match = _VAR_RE.fullmatch(value)
+        if match:
+            return lookup(match.group(1), value)
+
+        return _VAR_RE.sub(lambda m: str(lookup(m.group(1), m.group(0))), value)
+
     async def _execute_command(self, command: str, parameters: dict[str, Any],
                             context: WorkflowContext) -> Any:
         """Execute a single command"""
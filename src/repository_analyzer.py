@@ -7,6 +7,7 @@ and development workflows for conversion into Claude Code slash commands.
 """
 
 import ast
+import functools
 import json
 import os
 import re
@@ -17,6 +18,56 @@ from typing import Any
 from github import Github
 from github.Repository import Repository
 
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# URL prefixes split without a regex; anything else falls back to _REPO_PATH_RES
+_GITHUB_PREFIXES = ('https://github.com/', 'http://github.com/', 'github.com/')
+_REPO_PATH_RES = (
+    re.compile(r'github\.com/([^/]+/[^/]+?)(?:\.git)?/?$'),
+    re.compile(r'github\.com/([^/]+/[^/]+)'),
+)
+
+# README heading prefixes (level 2 or deeper) and the flag each one sets
+_README_SECTION_FLAGS = (
+    ('installation', 'has_installation'),
+    ('usage', 'has_usage'),
+    ('contributing', 'has_contributing'),
+    ('license', 'has_license'),
+)
+_BADGE_RE = re.compile(r'\[!\[.*?\]\(.*?\)\]')
+
+
+class _PythonPatternVisitor(ast.NodeVisitor):
+    """Collect class and function patterns from a parsed module in one traversal"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.patterns: list[dict[str, Any]] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.patterns.append({
+            'type': 'class_pattern',
+            'name': node.name,
+            'file': self.file_path,
+            'methods': [n.name for n in node.body if isinstance(n, _FUNCTION_NODES)],
+            'decorators': [ast.unparse(d) for d in node.decorator_list],
+            'pattern_category': 'architecture'
+        })
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.patterns.append({
+            'type': 'function_pattern',
+            'name': node.name,
+            'file': self.file_path,
+            'args': [arg.arg for arg in node.args.args],
+            'decorators': [ast.unparse(d) for d in node.decorator_list],
+            'pattern_category': 'code_structure'
+        })
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
 
 class RepositoryAnalyzer:
     """Main analyzer class for extracting patterns from GitHub repositories"""
@@ -63,15 +114,19 @@ class RepositoryAnalyzer:
 
         return analysis
 
-    def _extract_repo_path(self, repo_url: str) -> str | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_repo_path(repo_url: str) -> str | None:
         """Extract owner/repo path from GitHub URL"""
-        patterns = [
-            r'github\.com/([^/]+/[^/]+?)(?:\.git)?/?$',
-            r'github\.com/([^/]+/[^/]+)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, repo_url)
+        for prefix in _GITHUB_PREFIXES:
+            if repo_url.startswith(prefix):
+                owner, _, rest = repo_url[len(prefix):].partition('/')
+                repo = rest.partition('/')[0].partition('?')[0].partition('#')[0]
+                repo = repo.removesuffix('.git')
+                return f'{owner}/{repo}' if owner and repo else None
+
+        for pattern in _REPO_PATH_RES:
+            match = pattern.search(repo_url)
             if match:
                 return match.group(1)
         return None
@@ -230,7 +285,9 @@ class RepositoryAnalyzer:
 
         return docs_analysis
 
-    def _is_config_file(self, filename: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_config_file(filename: str) -> bool:
         """Check if file is a configuration file"""
         config_patterns = [
             r'.*\.conf$', r'.*\.config$', r'.*\.cfg$', r'.*\.ini$',
@@ -248,7 +305,9 @@ class RepositoryAnalyzer:
         ]
         return filename.lower() in package_files
 
-    def _is_entry_point(self, filename: str, filepath: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_entry_point(filename: str, filepath: str) -> bool:
         """Check if file is a main entry point"""
         entry_patterns = [
             r'main\.(py|js|go|rs)$',
@@ -281,40 +340,14 @@ class RepositoryAnalyzer:
 
     def _analyze_python_patterns(self, content: str, file_path: str) -> list[dict[str, Any]]:
         """Analyze Python code for patterns"""
-        patterns = []
+        visitor = _PythonPatternVisitor(file_path)
 
         try:
-            tree = ast.parse(content)
-
-            # Analyze class structure
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    pattern = {
-                        'type': 'class_pattern',
-                        'name': node.name,
-                        'file': file_path,
-                        'methods': [n.name for n in node.body if isinstance(n, ast.FunctionDef)],
-                        'decorators': [ast.unparse(d) for d in node.decorator_list],
-                        'pattern_category': 'architecture'
-                    }
-                    patterns.append(pattern)
-
-                elif isinstance(node, ast.FunctionDef):
-                    # Analyze function patterns
-                    pattern = {
-                        'type': 'function_pattern',
-                        'name': node.name,
-                        'file': file_path,
-                        'args': [arg.arg for arg in node.args.args],
-                        'decorators': [ast.unparse(d) for d in node.decorator_list],
-                        'pattern_category': 'code_structure'
-                    }
-                    patterns.append(pattern)
-
+            visitor.visit(ast.parse(content))
         except Exception as e:
             print(f"Error parsing Python code in {file_path}: {e}")
 
-        return patterns
+        return visitor.patterns
 
     def _analyze_javascript_patterns(self, content: str, file_path: str) -> list[dict[str, Any]]:
         """Analyze JavaScript/TypeScript code for patterns"""
@@ -430,21 +463,41 @@ class RepositoryAnalyzer:
         return workflows
 
     def _analyze_readme_structure(self, content: str) -> dict[str, Any]:
-        """Analyze README structure and content patterns"""
+        """Analyze README structure and content patterns in one pass over its lines"""
         structure = {
             'sections': [],
-            'has_badges': bool(re.search(r'\[!\[.*?\]\(.*?\)\]', content)),
-            'has_installation': bool(re.search(r'##\s*Installation', content, re.IGNORECASE)),
-            'has_usage': bool(re.search(r'##\s*Usage', content, re.IGNORECASE)),
-            'has_contributing': bool(re.search(r'##\s*Contributing', content, re.IGNORECASE)),
-            'has_license': bool(re.search(r'##\s*License', content, re.IGNORECASE)),
-            'code_examples': len(re.findall(r'```[\s\S]*?```', content))
+            'has_badges': False,
+            'has_installation': False,
+            'has_usage': False,
+            'has_contributing': False,
+            'has_license': False,
+            'code_examples': 0
         }
-
-        # Extract sections
-        sections = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-        structure['sections'] = sections
-
+        fences = 0
+
+        for line in content.splitlines():
+            if line.lstrip().startswith('```'):
+                fences += 1
+                continue
+            if fences % 2:
+                # Inside a code block: '#' lines are comments, not headings
+                continue
+
+            if line.startswith('#'):
+                title = line.lstrip('#')
+                level = len(line) - len(title)
+                if level <= 6 and title[:1].isspace() and title.strip():
+                    structure['sections'].append(title.strip())
+                if level >= 2:
+                    heading = title.lstrip().lower()
+                    for prefix, flag in _README_SECTION_FLAGS:
+                        if heading.startswith(prefix):
+                            structure[flag] = True
+
+            if not structure['has_badges'] and '[![' in line and _BADGE_RE.search(line):
+                structure['has_badges'] = True
+
+        structure['code_examples'] = fences // 2
         return structure
 
 
@@ -0,0 +1,121 @@
+"""Shared pytest fixtures for the OOS test suite."""
+
+import copy
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+# Knowledge adapters read this at construction; a stray real request fails fast
+os.environ.setdefault("KNOWLEDGE_TIMEOUT", "1")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Use real AI and Archon endpoints instead of mocked responses",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_network(request):
+    """Replace AI and Archon network calls with canned AsyncMock responses"""
+    if request.config.getoption("--live"):
+        yield
+        return
+
+    from ai_provider import AIResponse, OpenRouterProvider, ProviderType
+    from archon_sync import ArchonSyncManager
+
+    response = AIResponse(
+        content="Test successful",
+        model_used="nvidia/nemotron-nano-12b-v2-vl:free",
+        provider=ProviderType.OPENROUTER,
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENROUTER_API_KEY", "test-key")
+        mp.setenv("ARCHON_PROJECT_ID", "test-project")
+        archon_task = {"id": "archon-task"}
+        with (
+            patch.object(OpenRouterProvider, "chat_completion",
+                         AsyncMock(return_value=response)),
+            patch.object(OpenRouterProvider, "health_check",
+                         AsyncMock(return_value=True)),
+            patch.object(ArchonSyncManager, "_get_archon_tasks",
+                         AsyncMock(return_value=[])),
+            patch.object(ArchonSyncManager, "_create_archon_task",
+                         AsyncMock(return_value=archon_task)),
+            patch.object(ArchonSyncManager, "_update_archon_task",
+                         AsyncMock(return_value=archon_task)),
+            patch.object(ArchonSyncManager, "_upload_to_knowledge_base",
+                         AsyncMock(return_value={"success": True})),
+            patch.object(ArchonSyncManager, "sync_heartbeat",
+                         AsyncMock(return_value=True)),
+        ):
+            yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ai_manager(mock_network):
+    """Global AI manager, shared by the whole session and closed once"""
+    from ai_provider import get_ai_manager
+
+    manager = get_ai_manager()
+    yield manager
+    await manager.close_all()
+
+
+@pytest.fixture(scope="session")
+def relayq_config(tmp_path_factory):
+    """RelayQ config path private to this pytest-xdist worker (or the main process)"""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return tmp_path_factory.mktemp(f"relayq-{worker_id}") / "config.json"
+
+
+@pytest.fixture(scope="session")
+def _relayq_template(relayq_config):
+    """RelayQ manager backed by a config file generated once per session"""
+    from relayq_architecture import RelayQManager
+
+    return RelayQManager(str(relayq_config))
+
+
+@pytest.fixture
+def relayq_manager(_relayq_template):
+    """Per-test copy of the session RelayQ manager so node state never leaks"""
+    return copy.deepcopy(_relayq_template)
+
+
+@pytest.fixture(scope="session")
+def global_relayq_manager():
+    """Global RelayQ manager, resolved once per session"""
+    from relayq_architecture import get_relayq_manager
+
+    return get_relayq_manager()
+
+
+@pytest.fixture(scope="session")
+def _deployment_task_template():
+    """DeploymentTask targeting the local node, built once per session"""
+    from relayq_architecture import DeploymentTask
+
+    return DeploymentTask(task_id="template", command="true",
+                          target_nodes=["ocivm-dev"])
+
+
+@pytest.fixture
+def deployment_task(_deployment_task_template):
+    """Per-test copy of the template; set task_id and command before use"""
+    return copy.copy(_deployment_task_template)
+
+
+@pytest.fixture(scope="session")
+def sync_manager(mock_network):
+    """Global Archon sync manager"""
+    from archon_sync import get_sync_manager
+
+    return get_sync_manager()
@@ -1,46 +1,42 @@
-import unittest
 from unittest.mock import patch
 
 from lib.health_check import Colors, run_health_check
 
 
-class TestHealthCheck(unittest.TestCase):
+def _which_patch(paths):
+    """Patch shutil.which so each command resolves to its entry in paths."""
+    return patch("shutil.which", side_effect=paths.get)
 
-    @patch('shutil.which')
-    @patch('builtins.print')
-    def test_health_check_all_ok(self, mock_print, mock_which):
-        """Test the health check when all dependencies are found."""
-        # Arrange: Mock that all executables are found
-        mock_which.side_effect = lambda cmd: f'/usr/bin/{cmd}' # Return a path for any command
 
-        # Act
-        exit_code = run_health_check()
+def test_health_check_all_ok(capsys):
+    """Test the health check when all dependencies are found."""
+    # Arrange: Mock that all executables are found
+    paths = {"python3": "/usr/bin/python3", "git": "/usr/bin/git", "op": "/usr/bin/op"}
 
-        # Assert
-        self.assertEqual(exit_code, 0)
-        mock_print.assert_any_call(f"{Colors.GREEN}[OK]{Colors.END} python")
-        mock_print.assert_any_call(f"{Colors.GREEN}[OK]{Colors.END} git")
-        mock_print.assert_any_call(f"{Colors.GREEN}[OK]{Colors.END} op (1Password CLI)")
-
-    @patch('shutil.which')
-    @patch('builtins.print')
-    def test_health_check_one_missing(self, mock_print, mock_which):
-        """Test the health check when one dependency is missing."""
-        # Arrange: Mock that 'op' is not found
-        def which_se(cmd):
-            if cmd == 'op':
-                return None
-            return f'/usr/bin/{cmd}'
-        mock_which.side_effect = which_se
-
-        # Act
+    # Act
+    with _which_patch(paths):
         exit_code = run_health_check()
+    output = capsys.readouterr().out
+
+    # Assert
+    assert exit_code == 0
+    assert f"{Colors.GREEN}[OK]{Colors.END} python" in output
+    assert f"{Colors.GREEN}[OK]{Colors.END} git" in output
+    assert f"{Colors.GREEN}[OK]{Colors.END} op (1Password CLI)" in output
+
 
-        # Assert
-        self.assertEqual(exit_code, 1)
-        mock_print.assert_any_call(f"{Colors.GREEN}[OK]{Colors.END} python")
-        mock_print.assert_any_call(f"{Colors.GREEN}[OK]{Colors.END} git")
-        mock_print.assert_any_call(f"{Colors.RED}[FAIL]{Colors.END} op (1Password CLI)")
+def test_health_check_one_missing(capsys):
+    """Test the health check when one dependency is missing."""
+    # Arrange: Mock that 'op' is not found
+    paths = {"python3": "/usr/bin/python3", "git": "/usr/bin/git", "op": None}
+
+    # Act
+    with _which_patch(paths):
+        exit_code = run_health_check()
+    output = capsys.readouterr().out
 
-if __name__ == '__main__':
-    unittest.main()
+    # Assert
+    assert exit_code == 1
+    assert f"{Colors.GREEN}[OK]{Colors.END} python" in output
+    assert f"{Colors.GREEN}[OK]{Colors.END} git" in output
+    assert f"{Colors.RED}[FAIL]{Colors.END} op (1Password CLI)" in output
@@ -3,15 +3,14 @@
 Test suite for the Knowledge Resolver
 """
 
-import sys
-from pathlib import Path
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from knowledge_resolver import (
     Context7Adapter,
     DeepResearchAdapter,
@@ -22,6 +21,70 @@ from knowledge_resolver import (
 )
 
 
+def _ok_response(payload=None) -> Mock:
+    """Build a 200 response whose json() returns payload"""
+    response = Mock(status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+# Canned responses, built once at import; tests only read them
+_HEALTH_RESP = _ok_response()
+_CONTEXT7_RESOLVE_RESP = _ok_response({"resourceUri": "context7://libraries/test"})
+_CONTEXT7_SEARCH_RESP = _ok_response({
+    "content": "API documentation with various capabilities",
+    "sources": [{"url": "http://docs.example.com", "title": "API Docs"}]
+})
+_DOCS_MCP_RESP = _ok_response({
+    "results": [{"content": "API access and web interface available"}],
+    "sources": [{"url": "http://docs.example.com", "title": "Documentation"}]
+})
+_DEEP_RESEARCH_RESP = _ok_response({
+    "findings": [{"content": "Comprehensive API capabilities with pricing info"}],
+    "sources": [{"url": "http://research.example.com", "title": "Research"}],
+    "summary": "Research completed successfully"
+})
+
+
+class _StubAdapter:
+    """Adapter double with canned is_available() and query() answers"""
+
+    def __init__(self, available: bool = True, result: KnowledgeResult | None = None):
+        self.available = available
+        self.result = result
+
+    async def is_available(self) -> bool:
+        return self.available
+
+    async def query(self, query: str, domain: str) -> KnowledgeResult | None:
+        return self.result
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """Answers every GET with an empty 200 on a kept-alive connection"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def health_server():
+    """Local HTTP server for checks that need a real connection; yields its URL"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
 class TestKnowledgeResult:
     """Test cases for KnowledgeResult dataclass"""
 
@@ -69,9 +132,9 @@ class TestKnowledgeResult:
 class TestContext7Adapter:
     """Test cases for Context7Adapter"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def adapter(self):
-        """Create a test adapter"""
+        """Create a test adapter, shared by the module"""
         return Context7Adapter()
 
     def test_adapter_initialization(self):
@@ -80,133 +143,73 @@ class TestContext7Adapter:
         assert adapter.base_url is not None
         assert adapter.timeout is not None
 
-    @pytest.mark.asyncio
-    async def test_is_available_success(self, adapter):
-        """Test is_available when server is reachable"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
+    def test_is_available_across_event_loops(self, health_server, monkeypatch):
+        """Test one adapter keeps working when each call runs in a fresh asyncio.run()"""
+        monkeypatch.setenv("CONTEXT7_URL", health_server)
+        adapter = Context7Adapter()
 
-            result = await adapter.is_available()
-            assert result is True
+        assert asyncio.run(adapter.is_available()) is True
+        assert asyncio.run(adapter.is_available()) is True
 
-    @pytest.mark.asyncio
-    async def test_is_available_failure(self, adapter):
+    @patch.object(httpx.AsyncClient, 'get', new_callable=AsyncMock, return_value=_HEALTH_RESP)
+    async def test_is_available_success(self, mock_get, adapter):
+        """Test is_available when server is reachable"""
+        result = await adapter.is_available()
+        assert result is True
+
+    @patch.object(httpx.AsyncClient, 'get', new_callable=AsyncMock,
+                  side_effect=Exception("Connection error"))
+    async def test_is_available_failure(self, mock_get, adapter):
         """Test is_available when server is not reachable"""
-        with patch('requests.get', side_effect=Exception("Connection error")):
-            result = await adapter.is_available()
-            assert result is False
+        result = await adapter.is_available()
+        assert result is False
 
-    @pytest.mark.asyncio
-    async def test_query_success(self, adapter):
-        """Test successful query"""
-        with patch('requests.post') as mock_post:
-            # Mock resolve-library-uri response
-            resolve_response = Mock()
-            resolve_response.status_code = 200
-            resolve_response.json.return_value = {
-                "resourceUri": "context7://libraries/test"
-            }
-
-            # Mock search-library-docs response
-            search_response = Mock()
-            search_response.status_code = 200
-            search_response.json.return_value = {
-                "content": "API documentation with various capabilities",
-                "sources": [
-                    {"url": "http://docs.example.com", "title": "API Docs"}
-                ]
-            }
-
-            mock_post.side_effect = [resolve_response, search_response]
-
-            result = await adapter.query("test query", "search/web")
-
-            assert result is not None
-            assert result.capabilities is not None
-            assert len(result.sources) == 1
-
-    @pytest.mark.asyncio
-    async def test_query_failure(self, adapter):
+    @patch.object(httpx.AsyncClient, 'post', new_callable=AsyncMock,
+                  side_effect=Exception("API error"))
+    async def test_query_failure(self, mock_post, adapter):
         """Test query failure"""
-        with patch('requests.post', side_effect=Exception("API error")):
-            result = await adapter.query("test query", "search/web")
-            assert result is None
-
-
-class TestDocsMCPAdapter:
-    """Test cases for DocsMCPAdapter"""
-
-    @pytest.fixture
-    def adapter(self):
-        """Create a test adapter"""
-        return DocsMCPAdapter()
-
-    @pytest.mark.asyncio
-    async def test_query_success(self, adapter):
+        result = await adapter.query("test query", "search/web")
+        assert result is None
+
+
+class TestAdapterQuery:
+    """Test successful queries across all adapters"""
+
+    @pytest.mark.parametrize("adapter_cls,responses,check", [
+        (Context7Adapter, [_CONTEXT7_RESOLVE_RESP, _CONTEXT7_SEARCH_RESP],
+         lambda r: r.capabilities is not None),
+        (DocsMCPAdapter, [_DOCS_MCP_RESP], lambda r: "API access" in r.capabilities),
+        (DeepResearchAdapter, [_DEEP_RESEARCH_RESP],
+         lambda r: r.summary == "Research completed successfully"),
+    ], ids=["context7", "docs_mcp", "deep_research"])
+    @patch.object(httpx.AsyncClient, 'post', new_callable=AsyncMock)
+    async def test_query_success(self, mock_post, adapter_cls, responses, check):
         """Test successful query"""
-        with patch('requests.post') as mock_post:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": [
-                    {"content": "API access and web interface available"}
-                ],
-                "sources": [
-                    {"url": "http://docs.example.com", "title": "Documentation"}
-                ]
-            }
-            mock_post.return_value = mock_response
-
-            result = await adapter.query("test query", "search/web")
-
-            assert result is not None
-            assert "API access" in result.capabilities
-            assert len(result.sources) == 1
-
+        mock_post.side_effect = responses
+        result = await adapter_cls().query("test query", "search/web")
 
-class TestDeepResearchAdapter:
-    """Test cases for DeepResearchAdapter"""
-
-    @pytest.fixture
-    def adapter(self):
-        """Create a test adapter"""
-        return DeepResearchAdapter()
-
-    @pytest.mark.asyncio
-    async def test_query_success(self, adapter):
-        """Test successful query"""
-        with patch('requests.post') as mock_post:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "findings": [
-                    {"content": "Comprehensive API capabilities with pricing info"}
-                ],
-                "sources": [
-                    {"url": "http://research.example.com", "title": "Research"}
-                ],
-                "summary": "Research completed successfully"
-            }
-            mock_post.return_value = mock_response
-
-            result = await adapter.query("test query", "search/web")
-
-            assert result is not None
-            assert result.summary == "Research completed successfully"
-            assert len(result.sources) == 1
+        assert result is not None
+        assert check(result)
+        assert len(result.sources) == 1
 
 
 class TestKnowledgeResolver:
     """Test cases for KnowledgeResolver"""
 
-    @pytest.fixture
-    def resolver(self):
-        """Create a test resolver"""
+    @pytest.fixture(scope="module")
+    def _resolver(self):
+        """Create a test resolver, shared by the module"""
         return KnowledgeResolver()
 
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def resolver(self, _resolver):
+        """Shared resolver whose adapters and cache are reset after each test"""
+        original = dict(_resolver.adapters)
+        yield _resolver
+        _resolver.adapters = original
+        _resolver._cache.clear()
+        _resolver._avail_cache.clear()
+
     async def test_resolver_initialization(self, resolver):
         """Test resolver initializes correctly"""
         assert resolver is not None
@@ -214,11 +217,9 @@ class TestKnowledgeResolver:
         assert 'docs_mcp' in resolver.adapters
         assert 'deep_research' in resolver.adapters
 
-    @pytest.mark.asyncio
     async def test_resolve_query_success(self, resolver):
         """Test successful query resolution"""
-        # Mock a successful adapter
-        mock_adapter = AsyncMock()
+        # Stub a successful adapter
         mock_result = KnowledgeResult(
             capabilities=["Test capability"],
             limits=[],
@@ -230,11 +231,9 @@ class TestKnowledgeResolver:
             summary="Test summary",
             confidence=0.8
         )
-        mock_adapter.query.return_value = mock_result
-        mock_adapter.is_available.return_value = True
 
-        # Replace first adapter with mock
-        resolver.adapters['context7'] = mock_adapter
+        # Replace first adapter with stub
+        resolver.adapters['context7'] = _StubAdapter(result=mock_result)
 
         result = await resolver.resolve_query("test query", "search/web")
 
@@ -242,17 +241,10 @@ class TestKnowledgeResolver:
         assert result.capabilities == ["Test capability"]
         assert result.confidence == 0.8
 
-    @pytest.mark.asyncio
     async def test_resolve_query_fallback(self, resolver):
         """Test fallback to other adapters"""
-        # Mock first adapter as unavailable
-        mock_adapter1 = AsyncMock()
-        mock_adapter1.is_available.return_value = False
-
-        # Mock second adapter as available but low confidence
-        mock_adapter2 = AsyncMock()
-        mock_adapter2.is_available.return_value = True
-        mock_adapter2.query.return_value = KnowledgeResult(
+        # Stub second adapter as available but low confidence
+        low_result = KnowledgeResult(
             capabilities=[],
             limits=[],
             quotas=[],
@@ -264,9 +256,7 @@ class TestKnowledgeResolver:
             confidence=0.3
         )
 
-        # Mock third adapter as available with good result
-        mock_adapter3 = AsyncMock()
-        mock_adapter3.is_available.return_value = True
+        # Stub third adapter as available with good result
         mock_result = KnowledgeResult(
             capabilities=["Good capability"],
             limits=[],
@@ -278,12 +268,11 @@ class TestKnowledgeResolver:
             summary="Good result",
             confidence=0.8
         )
-        mock_adapter3.query.return_value = mock_result
 
-        # Replace adapters
-        resolver.adapters['context7'] = mock_adapter1
-        resolver.adapters['docs_mcp'] = mock_adapter2
-        resolver.adapters['deep_research'] = mock_adapter3
+        # Replace adapters; the first is unavailable
+        resolver.adapters['context7'] = _StubAdapter(available=False)
+        resolver.adapters['docs_mcp'] = _StubAdapter(result=low_result)
+        resolver.adapters['deep_research'] = _StubAdapter(result=mock_result)
 
         result = await resolver.resolve_query("test query", "search/web")
 
@@ -291,14 +280,71 @@ class TestKnowledgeResolver:
         assert result.capabilities == ["Good capability"]
         assert result.confidence == 0.8
 
-    @pytest.mark.asyncio
+    async def test_resolve_query_cache_hit(self, resolver):
+        """Test a repeated query is answered from the cache"""
+        cached = KnowledgeResult(
+            capabilities=["Cached capability"],
+            limits=[],
+            quotas=[],
+            api_access=True,
+            auth_methods=[],
+            pricing_notes=[],
+            sources=[],
+            summary="Cached",
+            confidence=0.8
+        )
+        resolver.adapters['context7'] = _StubAdapter(result=cached)
+        first = await resolver.resolve_query("test query", "search/web")
+
+        # A second lookup must not reach the adapters at all
+        for adapter_name in resolver.adapters:
+            resolver.adapters[adapter_name] = _StubAdapter(available=False)
+        second = await resolver.resolve_query("test query", "search/web")
+
+        assert first is cached
+        assert second is cached
+
+    async def test_resolve_query_reuses_availability(self, resolver):
+        """Test adapter health is not re-probed within the TTL"""
+        probes = []
+
+        class CountingProbe(_StubAdapter):
+            async def is_available(self):
+                probes.append(1)
+                return False
+
+        for adapter_name in resolver.adapters:
+            resolver.adapters[adapter_name] = CountingProbe()
+
+        await resolver.resolve_query("first query", "search/web")
+        await resolver.resolve_query("second query", "search/web")
+
+        assert len(probes) == len(resolver.adapters)
+
+    async def test_resolve_query_probes_concurrently(self, resolver):
+        """Test availability probes for all adapters overlap"""
+        probes = {"in_flight": 0, "peak": 0}
+
+        class SlowProbe(_StubAdapter):
+            async def is_available(self):
+                probes["in_flight"] += 1
+                probes["peak"] = max(probes["peak"], probes["in_flight"])
+                await asyncio.sleep(0.01)
+                probes["in_flight"] -= 1
+                return False
+
+        for adapter_name in resolver.adapters:
+            resolver.adapters[adapter_name] = SlowProbe()
+
+        await resolver.resolve_query("test query", "search/web")
+
+        assert probes["peak"] == len(resolver.adapters)
+
     async def test_resolve_query_all_fail(self, resolver):
         """Test when all adapters fail"""
-        # Mock all adapters as unavailable
+        # Stub all adapters as unavailable
         for adapter_name in resolver.adapters:
-            mock_adapter = AsyncMock()
-            mock_adapter.is_available.return_value = False
-            resolver.adapters[adapter_name] = mock_adapter
+            resolver.adapters[adapter_name] = _StubAdapter(available=False)
 
         result = await resolver.resolve_query("test query", "search/web")
 
@@ -306,7 +352,6 @@ class TestKnowledgeResolver:
         assert result.capabilities == []
         assert result.confidence == 0.0
 
-    @pytest.mark.asyncio
     async def test_resolve_knowledge_convenience_function(self):
         """Test convenience resolve_knowledge function"""
         from knowledge_resolver import resolve_knowledge
@@ -336,7 +381,7 @@ class TestKnowledgeResolver:
 class TestIntegration:
     """Integration tests for knowledge resolver"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="not implemented; requires live adapters")
     async def test_end_to_end_workflow(self):
         """Test complete workflow from query to result"""
         # This would test with real adapters in a real scenario
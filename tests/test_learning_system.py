@@ -5,12 +5,18 @@ Validates pattern detection, usage tracking, and recommendation generation
 """
 
 import asyncio
+import contextlib
+import dataclasses
 import os
 import sqlite3
 import sys
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -18,6 +24,7 @@ sys.path.insert(0, str(project_root))
 
 # Try to import the learning system
 try:
+    import src.learning_system
     from src.learning_system import (
         ImprovementSuggestion,
         LearningData,
@@ -34,82 +41,75 @@ except ImportError as e:
     LEARNING_SYSTEM_AVAILABLE = False
 
 
+@contextlib.contextmanager
+def _isolated_env():
+    """Yield a throwaway directory, on tmpfs when available"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(dir=base, ignore_cleanup_errors=True) as temp_dir:
+        yield temp_dir
+
+
+@pytest.mark.skipif(
+    not LEARNING_SYSTEM_AVAILABLE, reason="Learning system dependencies not available"
+)
 class TestLearningSystem:
     """Test suite for Learning & Improvement System"""
 
     def setup_method(self):
         """Setup test environment"""
-        self.test_results = []
-        self.temp_dir = None
-        self.db_path = None
+        self.systems = []
+        self._env = contextlib.ExitStack()
 
-        if not LEARNING_SYSTEM_AVAILABLE:
-            self.skip_all_tests()
-            return
-
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_learning.db")
+        # Each LearningSystem gets a private in-memory database; the temp
+        # directory is only for tests that need a real file
+        self.db_path = ":memory:"
+        self.temp_dir = self._env.enter_context(_isolated_env())
 
     def teardown_method(self):
         """Clean up test environment"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            import shutil
-            shutil.rmtree(self.temp_dir)
-
-    def skip_all_tests(self):
-        """Skip all tests if learning system is not available"""
-        print("⚠️  Skipping Learning System tests due to missing dependencies")
-        self.test_results = [{"name": "Learning System", "status": "skipped", "error": "Dependencies not available"}]
-
-    def run_test(self, test_name, test_func):
-        """Run a single test and track results"""
-        if not LEARNING_SYSTEM_AVAILABLE:
-            return False
-
-        try:
-            self.setup_method()
-            test_func()
-            print(f"✅ {test_name}")
-            self.test_results.append({"name": test_name, "status": "passed"})
-            return True
-        except Exception as e:
-            print(f"❌ {test_name}: {e}")
-            self.test_results.append({"name": test_name, "status": "failed", "error": str(e)})
-            return False
-        finally:
-            self.teardown_method()
+        for learning_system in self.systems:
+            learning_system.close()
+        self._env.close()
+
+    def _system(self, **kwargs) -> LearningSystem:
+        """Create a LearningSystem (in memory by default); closed in teardown"""
+        kwargs.setdefault("db_path", self.db_path)
+        learning_system = LearningSystem(**kwargs)
+        self.systems.append(learning_system)
+        return learning_system
+
+    @contextlib.contextmanager
+    def _fresh_global_instance(self):
+        """Clear the global instance and keep its default database in this test's temp dir"""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("HOME", self.temp_dir)
+            mp.setattr(src.learning_system, "_learning_instance", None)
+            yield
+            if src.learning_system._learning_instance is not None:
+                self.systems.append(src.learning_system._learning_instance)
+
+    def _query(self, learning_system, sql, params=()):
+        """Run a query over the system's own connection and return all rows"""
+        return learning_system._get_conn().execute(sql, params).fetchall()
 
     def test_database_initialization(self):
         """Test database initialization and table creation"""
-        print("\n🧪 Testing Database Initialization...")
 
-        LearningSystem(db_path=self.db_path)
+        self.db_path = os.path.join(self.temp_dir, "test_learning.db")
+        learning_system = self._system()
 
         # Check that database file is created
         assert os.path.exists(self.db_path)
 
         # Check that tables are created
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Check learning_data table
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='learning_data'")
-            assert cursor.fetchone() is not None
-
-            # Check patterns table
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='patterns'")
-            assert cursor.fetchone() is not None
-
-            # Check suggestions table
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='suggestions'")
-            assert cursor.fetchone() is not None
+        table_sql = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+        for table in ("learning_data", "patterns", "suggestions"):
+            assert self._query(learning_system, table_sql, (table,))
 
     def test_usage_recording(self):
         """Test usage data recording"""
-        print("\n🧪 Testing Usage Recording...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Create test learning data
         learning_data = LearningData(
@@ -128,26 +128,97 @@ class TestLearningSystem:
         learning_system.record_usage(learning_data)
 
         # Verify data is stored
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM learning_data")
-            count = cursor.fetchone()[0]
-            assert count == 1
-
-            # Verify data content
-            cursor.execute("SELECT * FROM learning_data")
-            record = cursor.fetchone()
-            assert record[2] == "test_user"  # user_id
-            assert record[3] == "test_session"  # session_id
-            assert record[4] == "test-command"  # command_name
-            assert record[7] == 1  # success (SQLite stores boolean as 1/0)
+        count = self._query(learning_system, "SELECT COUNT(*) FROM learning_data")[0][0]
+        assert count == 1
+
+        # Verify data content, fetching only the columns under test by name
+        cursor = learning_system._get_conn().cursor()
+        cursor.row_factory = sqlite3.Row
+        record = cursor.execute(
+            "SELECT user_id, session_id, command_name, success FROM learning_data"
+        ).fetchone()
+        assert record["user_id"] == "test_user"
+        assert record["session_id"] == "test_session"
+        assert record["command_name"] == "test-command"
+        assert record["success"] == 1  # SQLite stores boolean as 1/0
+
+    def test_record_usage_bulk_matches_single(self):
+        """Test bulk recording stores exactly what per-row recording does"""
+
+        base_time = datetime.now()
+        records = [
+            LearningData(
+                timestamp=base_time + timedelta(seconds=i),
+                user_id="test_user",
+                session_id=f"session_{i % 2}",
+                command_name=f"command-{i}",
+                parameters={"index": i},
+                execution_time=0.5 * i,
+                success=i % 3 != 0,
+                error_message=None if i % 3 else "failed",
+                context={"workspace": "/test/workspace"}
+            )
+            for i in range(6)
+        ]
+
+        single = self._system()
+        for record in records:
+            single.record_usage(record)
+
+        bulk = self._system()
+        bulk.record_usage_many(iter(records))
+
+        sql = "SELECT * FROM learning_data ORDER BY id"
+        assert self._query(bulk, sql) == self._query(single, sql)
+
+    def test_dumps_backends_store_same_text(self):
+        """Test the orjson and stdlib serializers write identical rows"""
+        value = {"name": "héllo ✓", 1: [1, 2.5, None, True], "nested": {"x": -3}}
+        expected = '{"name":"héllo ✓","1":[1,2.5,null,true],"nested":{"x":-3}}'
+        assert src.learning_system._json_dumps(value) == expected
+        assert src.learning_system._dumps(value) == expected
+
+    @pytest.mark.parametrize("dumps", ["_dumps", "_json_dumps"])
+    def test_dumps_rejects_datetimes(self, dumps):
+        """Test both serializers reject values json can't represent"""
+        with pytest.raises(TypeError):
+            getattr(src.learning_system, dumps)({"when": datetime.now()})
+
+    def test_record_usage_concurrent_threads(self):
+        """Test concurrent writers on the shared connection don't interleave transactions"""
+        learning_system = self._system()
+        base_time = datetime.now()
+
+        def record(thread_index):
+            for batch in range(20):
+                learning_system.record_usage_many(
+                    LearningData(
+                        timestamp=base_time,
+                        user_id="test_user",
+                        session_id=f"session_{thread_index}",
+                        command_name=f"command-{batch}-{i}",
+                        parameters={},
+                        execution_time=1.0,
+                        success=True,
+                        error_message=None,
+                        context={}
+                    )
+                    for i in range(5)
+                )
+
+        threads = [threading.Thread(target=record, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self._query(learning_system, "SELECT COUNT(*) FROM learning_data")[0][0] == 400
 
     def test_pattern_learning_disabled(self):
         """Test pattern learning when disabled"""
-        print("\n🧪 Testing Pattern Learning When Disabled...")
 
         config = {"learning_enabled": False}
-        learning_system = LearningSystem(db_path=self.db_path, config=config)
+        learning_system = self._system(config=config)
 
         # Record some usage data
         learning_data = LearningData(
@@ -161,36 +232,47 @@ class TestLearningSystem:
             error_message=None,
             context={}
         )
-        learning_system.record_usage(learning_data)
+        # None of the disabled paths should reach the database
+        with patch.object(learning_system, "_get_conn") as get_conn:
+            learning_system.record_usage(learning_data)
+
+            # Try to learn patterns (should return empty)
+            patterns = asyncio.run(learning_system.learn_patterns())
+            suggestions = asyncio.run(learning_system.generate_suggestions())
 
-        # Try to learn patterns (should return empty)
-        patterns = asyncio.run(learning_system.learn_patterns())
         assert len(patterns) == 0
+        assert suggestions == []
+        get_conn.assert_not_called()
 
     def test_command_sequence_learning(self):
         """Test command sequence pattern learning"""
-        print("\n🧪 Testing Command Sequence Learning...")
 
         # Use short learning interval for testing
-        learning_system = LearningSystem(db_path=self.db_path, config={"learning_interval_hours": 0})
+        learning_system = self._system(config={"learning_interval_hours": 0})
 
-        # Record command sequences
+        # Record command sequences: analyze -> generate -> execute
         base_time = datetime.now()
-        for i in range(5):
-            # Record a sequence: analyze -> generate -> execute
-            for cmd in ["analyze-repository", "generate-commands", "execute-workflow"]:
-                learning_data = LearningData(
-                    timestamp=base_time + timedelta(seconds=i*10),
-                    user_id="test_user",
-                    session_id=f"session_{i}",
-                    command_name=cmd,
-                    parameters={},
-                    execution_time=1.0,
-                    success=True,
-                    error_message=None,
-                    context={}
-                )
-                learning_system.record_usage(learning_data)
+        template = LearningData(
+            timestamp=base_time,
+            user_id="test_user",
+            session_id="",
+            command_name="",
+            parameters={},
+            execution_time=1.0,
+            success=True,
+            error_message=None,
+            context={}
+        )
+        learning_system.record_usage_many([
+            dataclasses.replace(
+                template,
+                timestamp=base_time + timedelta(seconds=i*10),
+                session_id=f"session_{i}",
+                command_name=cmd,
+            )
+            for i in range(5)
+            for cmd in ["analyze-repository", "generate-commands", "execute-workflow"]
+        ])
 
         # Learn patterns
         patterns = asyncio.run(learning_system.learn_patterns())
@@ -207,15 +289,15 @@ class TestLearningSystem:
 
     def test_parameter_pattern_learning(self):
         """Test parameter pattern learning"""
-        print("\n🧪 Testing Parameter Pattern Learning...")
 
         # Use short learning interval for testing
-        learning_system = LearningSystem(db_path=self.db_path, config={"learning_interval_hours": 0})
+        learning_system = self._system(config={"learning_interval_hours": 0})
 
         # Record parameter usage patterns
-        for i in range(5):
-            learning_data = LearningData(
-                timestamp=datetime.now() + timedelta(seconds=i),
+        base_time = datetime.now()
+        learning_system.record_usage_many([
+            LearningData(
+                timestamp=base_time + timedelta(seconds=i),
                 user_id="test_user",
                 session_id=f"session_{i}",
                 command_name="test-command",
@@ -225,7 +307,8 @@ class TestLearningSystem:
                 error_message=None,
                 context={}
             )
-            learning_system.record_usage(learning_data)
+            for i in range(5)
+        ])
 
         # Learn patterns
         patterns = asyncio.run(learning_system.learn_patterns())
@@ -242,15 +325,15 @@ class TestLearningSystem:
 
     def test_workflow_pattern_learning(self):
         """Test workflow usage pattern learning"""
-        print("\n🧪 Testing Workflow Pattern Learning...")
 
         # Use short learning interval for testing
-        learning_system = LearningSystem(db_path=self.db_path, config={"learning_interval_hours": 0})
+        learning_system = self._system(config={"learning_interval_hours": 0})
 
         # Record workflow executions
-        for i in range(5):
-            learning_data = LearningData(
-                timestamp=datetime.now() + timedelta(seconds=i),
+        base_time = datetime.now()
+        learning_system.record_usage_many([
+            LearningData(
+                timestamp=base_time + timedelta(seconds=i),
                 user_id="test_user",
                 session_id=f"session_{i}",
                 command_name="execute-workflow",
@@ -260,7 +343,8 @@ class TestLearningSystem:
                 error_message=None,
                 context={}
             )
-            learning_system.record_usage(learning_data)
+            for i in range(5)
+        ])
 
         # Learn patterns
         patterns = asyncio.run(learning_system.learn_patterns())
@@ -277,9 +361,8 @@ class TestLearningSystem:
 
     def test_suggestion_generation(self):
         """Test improvement suggestion generation"""
-        print("\n🧪 Testing Suggestion Generation...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Create some test patterns
         test_pattern = UsagePattern(
@@ -307,9 +390,8 @@ class TestLearningSystem:
 
     def test_recommendation_generation(self):
         """Test context-aware recommendation generation"""
-        print("\n🧪 Testing Recommendation Generation...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Create test patterns and suggestions
         test_pattern = UsagePattern(
@@ -350,14 +432,14 @@ class TestLearningSystem:
 
     def test_usage_statistics(self):
         """Test usage statistics generation"""
-        print("\n🧪 Testing Usage Statistics...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Record some usage data
-        for i in range(10):
-            learning_data = LearningData(
-                timestamp=datetime.now() + timedelta(seconds=i),
+        base_time = datetime.now()
+        learning_system.record_usage_many([
+            LearningData(
+                timestamp=base_time + timedelta(seconds=i),
                 user_id="test_user",
                 session_id=f"session_{i}",
                 command_name="test-command",
@@ -367,7 +449,8 @@ class TestLearningSystem:
                 error_message=None,
                 context={}
             )
-            learning_system.record_usage(learning_data)
+            for i in range(10)
+        ])
 
         # Get statistics
         stats = learning_system.get_usage_statistics()
@@ -383,9 +466,8 @@ class TestLearningSystem:
 
     def test_suggestion_implementation(self):
         """Test suggestion implementation tracking"""
-        print("\n🧪 Testing Suggestion Implementation...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Create a test suggestion
         suggestion = ImprovementSuggestion(
@@ -406,17 +488,17 @@ class TestLearningSystem:
         assert result is True
 
         # Verify suggestion is marked as implemented
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT implemented FROM suggestions WHERE suggestion_id = ?", ("test_suggestion_1",))
-            implemented = cursor.fetchone()[0]
-            assert implemented == 1  # SQLite stores boolean as 1/0
+        implemented = self._query(
+            learning_system,
+            "SELECT implemented FROM suggestions WHERE suggestion_id = ?",
+            ("test_suggestion_1",)
+        )[0][0]
+        assert implemented == 1  # SQLite stores boolean as 1/0
 
     def test_learning_interval(self):
         """Test learning interval functionality"""
-        print("\n🧪 Testing Learning Interval...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Set learning interval to 24 hours
         learning_system.config["learning_interval_hours"] = 24
@@ -443,13 +525,82 @@ class TestLearningSystem:
 
         assert patterns1 == patterns2
 
+    def test_learning_cache(self):
+        """Test pattern learning reuses results while the data is unchanged"""
+
+        learning_system = self._system(config={"learning_interval_hours": 0})
+
+        base_time = datetime.now()
+
+        def record(i):
+            learning_system.record_usage(LearningData(
+                timestamp=base_time + timedelta(seconds=i),
+                user_id="test_user",
+                session_id=f"session_{i}",
+                command_name="test-command",
+                parameters={"mode": "fast"},
+                execution_time=1.0,
+                success=True,
+                error_message=None,
+                context={}
+            ))
+
+        for i in range(3):
+            record(i)
+
+        patterns1 = asyncio.run(learning_system.learn_patterns())
+        patterns2 = asyncio.run(learning_system.learn_patterns())
+        assert patterns2 is patterns1
+
+        # New data must be mined again
+        record(3)
+        patterns3 = asyncio.run(learning_system.learn_patterns())
+        assert patterns3 is not patterns1
+        assert patterns3[0].frequency == 4
+
+    def test_learning_cache_invalidation(self):
+        """Test cached patterns are dropped when the threshold or the rows change"""
+        db_path = os.path.join(self.temp_dir, "learning.db")
+        learning_system = self._system(db_path=db_path, config={"learning_interval_hours": 0})
+
+        base_time = datetime.now()
+        learning_system.record_usage_many(
+            LearningData(
+                timestamp=base_time + timedelta(seconds=i),
+                user_id="test_user",
+                session_id=f"session_{i}",
+                command_name="test-command",
+                parameters={"mode": "fast"},
+                execution_time=1.0,
+                success=True,
+                error_message=None,
+                context={}
+            )
+            for i in range(3)
+        )
+
+        def commands(patterns):
+            return {p.pattern_data.get("command") for p in patterns}
+
+        assert commands(asyncio.run(learning_system.learn_patterns())) == {"test-command"}
+
+        # A stricter threshold must be applied rather than served from cache
+        learning_system.config["min_pattern_frequency"] = 4
+        assert asyncio.run(learning_system.learn_patterns()) == []
+
+        # So must an in-place update committed by another connection
+        learning_system.config["min_pattern_frequency"] = 3
+        assert commands(asyncio.run(learning_system.learn_patterns())) == {"test-command"}
+        with contextlib.closing(sqlite3.connect(db_path)) as other, other:
+            other.execute("UPDATE learning_data SET command_name = 'renamed'")
+        assert commands(asyncio.run(learning_system.learn_patterns())) == {"renamed"}
+
     def test_data_retention(self):
         """Test data retention policy"""
-        print("\n🧪 Testing Data Retention Policy...")
 
         # Set retention to 1 day
         config = {"retention_days": 1}
-        learning_system = LearningSystem(db_path=self.db_path, config=config)
+        learning_system = self._system(config=config)
 
         # Record old data
         old_data = LearningData(
@@ -463,7 +614,6 @@ class TestLearningSystem:
             error_message=None,
             context={}
         )
-        learning_system.record_usage(old_data)
 
         # Record recent data
         recent_data = LearningData(
@@ -477,7 +627,7 @@ class TestLearningSystem:
             error_message=None,
             context={}
         )
-        learning_system.record_usage(recent_data)
+        learning_system.record_usage_many([old_data, recent_data])
 
         # Learn patterns (should only use recent data)
         patterns = asyncio.run(learning_system.learn_patterns())
@@ -487,42 +637,35 @@ class TestLearningSystem:
 
     def test_global_instance(self):
         """Test global learning system instance"""
-        print("\n🧪 Testing Global Instance...")
 
         # Clear global instance
-        import src.learning_system
-        src.learning_system._learning_instance = None
-
-        # Get global instance
-        instance1 = get_learning_system()
-        instance2 = get_learning_system()
+        with self._fresh_global_instance():
+            # Get global instance
+            instance1 = get_learning_system()
+            instance2 = get_learning_system()
 
         # Should be the same instance
         assert instance1 is instance2
 
     def test_utility_functions(self):
         """Test utility functions"""
-        print("\n🧪 Testing Utility Functions...")
 
         # Clear global instance
-        import src.learning_system
-        src.learning_system._learning_instance = None
-
-        # Test record_command_usage
-        record_command_usage("test-command", {"param": "value"}, 1.0, True)
+        with self._fresh_global_instance():
+            # Test record_command_usage
+            record_command_usage("test-command", {"param": "value"}, 1.0, True)
 
-        # Get global instance and verify data was recorded
-        learning_system = get_learning_system()
-        stats = learning_system.get_usage_statistics()
+            # Get global instance and verify data was recorded
+            learning_system = get_learning_system()
+            stats = learning_system.get_usage_statistics()
         assert stats["total_usage"] >= 1
 
     def test_context_isolation(self):
         """Test that each learning system instance maintains isolated state"""
-        print("\n🧪 Testing Context Isolation...")
 
         # Create two separate learning systems
-        learning_system1 = LearningSystem(db_path=os.path.join(self.temp_dir, "db1.db"))
-        learning_system2 = LearningSystem(db_path=os.path.join(self.temp_dir, "db2.db"))
+        learning_system1 = self._system()
+        learning_system2 = self._system()
 
         # Record data in first system
         learning_data = LearningData(
@@ -548,9 +691,8 @@ class TestLearningSystem:
 
     def test_error_handling(self):
         """Test error handling for edge cases"""
-        print("\n🧪 Testing Error Handling...")
 
-        learning_system = LearningSystem(db_path=self.db_path)
+        learning_system = self._system()
 
         # Test recording usage with learning disabled
         learning_system.config["learning_enabled"] = False
@@ -577,64 +719,6 @@ class TestLearningSystem:
         result = learning_system.implement_suggestion("non-existent")
         assert result is False
 
-    def run_all_tests(self):
-        """Run all tests and provide summary"""
-        if not LEARNING_SYSTEM_AVAILABLE:
-            print("🚀 Learning System Tests")
-            print("=" * 60)
-            print("⚠️  Learning System tests skipped due to missing dependencies")
-            print("   Required: scikit-learn, numpy")
-            print("   Install with: pip install scikit-learn numpy")
-            return True
-
-        print("🚀 Testing Learning & Improvement System")
-        print("=" * 60)
-        print("Testing pattern detection, usage tracking, and recommendation generation")
-
-        test_functions = [
-            ("Learning System Initialization", self.test_initialization),
-            ("Database Initialization", self.test_database_initialization),
-            ("Usage Recording", self.test_usage_recording),
-            ("Pattern Learning Disabled", self.test_pattern_learning_disabled),
-            ("Command Sequence Learning", self.test_command_sequence_learning),
-            ("Parameter Pattern Learning", self.test_parameter_pattern_learning),
-            ("Workflow Pattern Learning", self.test_workflow_pattern_learning),
-            ("Suggestion Generation", self.test_suggestion_generation),
-            ("Recommendation Generation", self.test_recommendation_generation),
-            ("Usage Statistics", self.test_usage_statistics),
-            ("Suggestion Implementation", self.test_suggestion_implementation),
-            ("Learning Interval", self.test_learning_interval),
-            ("Data Retention", self.test_data_retention),
-            ("Global Instance", self.test_global_instance),
-            ("Utility Functions", self.test_utility_functions),
-            ("Context Isolation", self.test_context_isolation),
-            ("Error Handling", self.test_error_handling),
-        ]
-
-        passed = 0
-        total = len(test_functions)
-
-        for test_name, test_func in test_functions:
-            if self.run_test(test_name, test_func):
-                passed += 1
-
-        print("\n" + "=" * 60)
-        print(f"Test Results: {passed}/{total} passed")
-
-        if passed == total:
-            print("🎉 All tests passed! Learning & Improvement System is working correctly.")
-            print("\n✅ Context Engineering Principles Applied:")
-            print("  - Write: Usage patterns and learning data saved to structured database")
-            print("  - Select: Intelligent pattern detection and recommendation filtering")
-            print("  - Compress: Pattern compression and statistical analysis")
-            print("  - Isolate: Each learning system maintains independent context")
-        else:
-            print(f"❌ {total - passed} tests failed. Review the output above.")
-
-        return passed == total
-
 
 if __name__ == "__main__":
-    test_suite = TestLearningSystem()
-    success = test_suite.run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-v"]))
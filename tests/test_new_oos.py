@@ -1,8 +1,39 @@
 #!/usr/bin/env python3
 """Test script for the new OOS interface"""
+import functools
+import importlib.util
 import os
 import subprocess
+import sys
 import tempfile
+from pathlib import Path
+
+RUN_PY = Path(__file__).parent.parent / "run.py"
+
+
+@functools.lru_cache(maxsize=1)
+def _help_output():
+    """Run `run.py --help` once; the help text does not depend on the directory"""
+    result = subprocess.run([sys.executable, str(RUN_PY), '--help'],
+                            capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr
+
+
+@functools.lru_cache(maxsize=1)
+def _run_module():
+    """Import run.py once so tests can call its helpers in-process"""
+    sys.path.insert(0, str(RUN_PY.parent))
+    spec = importlib.util.spec_from_file_location("oos_run", RUN_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fake_git_repo(path):
+    """Create the minimal .git/ that run.py's context detection looks for"""
+    git_dir = Path(path) / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
 
 
 def test_empty_directory():
@@ -13,14 +44,13 @@ def test_empty_directory():
         os.chdir(tmp_dir)
 
         # Test the context detection
-        result = subprocess.run([
-            'python3', '/home/ubuntu/dev/oos/run.py', '--help'
-        ], capture_output=True, text=True)
+        returncode, _, stderr = _help_output()
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Help system works")
         else:
-            print(f"❌ Help failed: {result.stderr}")
+            print(f"❌ Help failed: {stderr}")
+        assert returncode == 0
 
 def test_existing_project():
     """Test existing project flow"""
@@ -30,17 +60,17 @@ def test_existing_project():
         os.chdir(tmp_dir)
 
         # Create a git repo
-        subprocess.run(['git', 'init'], capture_output=True)
+        _fake_git_repo(tmp_dir)
 
-        # Test help in git directory
-        result = subprocess.run([
-            'python3', '/home/ubuntu/dev/oos/run.py', '--help'
-        ], capture_output=True, text=True)
+        # Context detection runs in the current directory, so this one
+        # can't share the cached --help run
+        context = _run_module().detect_context()
 
-        if result.returncode == 0:
+        if context == "existing_project":
             print("✅ Existing project detection works")
         else:
-            print(f"❌ Existing project test failed: {result.stderr}")
+            print(f"❌ Existing project test failed: detected {context}")
+        assert context == "existing_project"
 
 def main():
     print("🚀 Testing New OOS Interface")
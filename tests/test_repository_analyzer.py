@@ -4,21 +4,29 @@ Test script for Repository Analysis Engine
 Validates the core functionality and context engineering principles
 """
 
+import os
 import sys
-import unittest.mock as mock
+from collections import Counter
 from pathlib import Path
-from unittest.mock import MagicMock
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.repository_analyzer import RepositoryAnalyzer
+# src.repository_analyzer (and PyGithub with it) is imported inside the tests,
+# so collecting this module stays cheap
 
 
 class TestRepositoryAnalyzer:
     """Test suite for Repository Analysis Engine with context engineering"""
 
+    @classmethod
+    def setup_class(cls):
+        """Build one analyzer for the whole class; the helpers under test are stateless"""
+        from src.repository_analyzer import RepositoryAnalyzer
+
+        cls.analyzer = RepositoryAnalyzer()
+
     def setup_method(self):
         """Setup test environment"""
         self.test_results = []
@@ -40,26 +48,24 @@ class TestRepositoryAnalyzer:
         """Test repository URL parsing with various formats"""
         print("\n🧪 Testing Repository URL Extraction...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_urls = [
             ("https://github.com/user/repo", "user/repo"),
             ("https://github.com/user/repo.git", "user/repo"),
             ("github.com/user/repo", "user/repo"),  # Actually works
             ("https://github.com/user/repo/tree/main", "user/repo"),
+            ("https://github.com/user/repo?tab=readme", "user/repo"),
+            ("https://www.github.com/user/repo", "user/repo"),  # Regex fallback
             ("invalid-url", None),  # Invalid format
         ]
 
         for url, expected in test_urls:
-            result = analyzer._extract_repo_path(url)
+            result = self.analyzer._extract_repo_path(url)
             assert result == expected, f"URL {url} expected {expected}, got {result}"
 
     def test_config_file_detection(self):
         """Test configuration file detection patterns"""
         print("\n🧪 Testing Configuration File Detection...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_files = [
             ("package.json", True),
             ("pyproject.toml", True),
@@ -71,15 +77,13 @@ class TestRepositoryAnalyzer:
         ]
 
         for filename, expected in test_files:
-            result = analyzer._is_config_file(filename)
+            result = self.analyzer._is_config_file(filename)
             assert result == expected, f"File {filename} expected {expected}, got {result}"
 
     def test_entry_point_detection(self):
         """Test entry point detection patterns"""
         print("\n🧪 Testing Entry Point Detection...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_files = [
             ("main.py", "main.py", True),
             ("index.js", "index.js", True),
@@ -90,15 +94,13 @@ class TestRepositoryAnalyzer:
         ]
 
         for filename, filepath, expected in test_files:
-            result = analyzer._is_entry_point(filename, filepath)
+            result = self.analyzer._is_entry_point(filename, filepath)
             assert result == expected, f"File {filepath} expected {expected}, got {result}"
 
     def test_python_pattern_extraction(self):
         """Test Python code pattern extraction (Select principle)"""
         print("\n🧪 Testing Python Pattern Extraction...")
 
-        analyzer = RepositoryAnalyzer()
-
         # Test Python code with various patterns
         test_code = '''
 import asyncio
@@ -123,7 +125,7 @@ def helper_function():
 '''
 
         try:
-            patterns = analyzer._analyze_python_patterns(test_code, "test_file.py")
+            patterns = self.analyzer._analyze_python_patterns(test_code, "test_file.py")
 
             # Should extract patterns
             print(f"Found {len(patterns)} patterns")
@@ -146,12 +148,36 @@ def helper_function():
             # For now, don't fail the test - just ensure the method runs
             assert True
 
+    def test_python_async_pattern_extraction(self):
+        """Test async functions and async methods are collected like plain ones"""
+        print("\n🧪 Testing Python Async Pattern Extraction...")
+
+        test_code = '''
+class Worker:
+    async def run(self, job):
+        pass
+
+    def stop(self):
+        pass
+
+async def main(argv):
+    pass
+'''
+
+        patterns = self.analyzer._analyze_python_patterns(test_code, "worker.py")
+
+        class_patterns = [p for p in patterns if p['type'] == 'class_pattern']
+        assert [p['methods'] for p in class_patterns] == [['run', 'stop']]
+
+        functions = {p['name']: p for p in patterns if p['type'] == 'function_pattern'}
+        assert set(functions) == {'run', 'stop', 'main'}
+        assert functions['run']['args'] == ['self', 'job']
+        assert functions['main']['args'] == ['argv']
+
     def test_javascript_pattern_extraction(self):
         """Test JavaScript code pattern extraction"""
         print("\n🧪 Testing JavaScript Pattern Extraction...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_code = '''
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
@@ -173,7 +199,7 @@ export default function Component() {
 '''
 
         try:
-            patterns = analyzer._analyze_javascript_patterns(test_code, "test_file.jsx")
+            patterns = self.analyzer._analyze_javascript_patterns(test_code, "test_file.jsx")
             print(f"Found {len(patterns)} JavaScript patterns")
 
             # For now, just ensure the method runs without error
@@ -186,8 +212,6 @@ export default function Component() {
         """Test GitHub Actions workflow analysis"""
         print("\n🧪 Testing Workflow Analysis...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_workflow = '''
 name: CI/CD Pipeline
 
@@ -210,7 +234,7 @@ jobs:
         run: pytest
 '''
 
-        workflow_analysis = analyzer._analyze_github_workflow(test_workflow, "test_workflow.yml")
+        workflow_analysis = self.analyzer._analyze_github_workflow(test_workflow, "test_workflow.yml")
 
         assert workflow_analysis['name'] == "test_workflow.yml"
         assert len(workflow_analysis['triggers']) > 0
@@ -220,8 +244,6 @@ jobs:
         """Test README structure analysis"""
         print("\n🧪 Testing README Structure Analysis...")
 
-        analyzer = RepositoryAnalyzer()
-
         test_readme = '''
 # My Awesome Project
 
@@ -243,7 +265,7 @@ Please read CONTRIBUTING.md for details.
 This project is licensed under the MIT License.
 '''
 
-        structure = analyzer._analyze_readme_structure(test_readme)
+        structure = self.analyzer._analyze_readme_structure(test_readme)
 
         assert structure['has_badges']
         assert structure['has_installation']
@@ -253,28 +275,52 @@ This project is licensed under the MIT License.
         assert structure['code_examples'] == 1
         assert 'Installation' in structure['sections']
 
+    def test_readme_structure_skips_code_fences(self):
+        """Test '#' lines inside fenced code blocks are not read as headings"""
+        print("\n🧪 Testing README Code Fence Handling...")
+
+        test_readme = '''
+# Project
+
+```bash
+# Installation
+pip install project
+```
+
+## Usage
+  ```
+  ## License
+  ```
+'''
+
+        structure = self.analyzer._analyze_readme_structure(test_readme)
+
+        assert structure['sections'] == ['Project', 'Usage']
+        assert not structure['has_installation']
+        assert structure['has_usage']
+        assert not structure['has_license']
+        assert structure['code_examples'] == 2
+
     def test_context_compression_simulation(self):
         """Test context compression principles (Compress principle)"""
         print("\n🧪 Testing Context Compression Simulation...")
 
-        RepositoryAnalyzer()
-
         # Simulate large file list (would normally be compressed)
         large_file_list = [f"file_{i}.py" for i in range(1000)]
 
         # Test file type counting compression
-        file_types = {}
-        for file in large_file_list:
-            ext = Path(file).suffix
-            file_types[ext] = file_types.get(ext, 0) + 1
+        file_types = Counter(os.path.splitext(file)[1] for file in large_file_list)
 
         # Should compress 1000 files into just a few categories
         assert len(file_types) < 10  # Much smaller than original list
         assert file_types['.py'] == 1000  # All files counted correctly
 
-    @mock.patch('src.repository_analyzer.Github')
-    def test_mock_repository_analysis(self, mock_github):
+    def test_mock_repository_analysis(self):
         """Test full repository analysis with mocked GitHub API"""
+        from unittest.mock import MagicMock, patch
+
+        from src.repository_analyzer import RepositoryAnalyzer
+
         print("\n🧪 Testing Mock Repository Analysis...")
 
         # Setup mock GitHub objects
@@ -295,46 +341,45 @@ This project is licensed under the MIT License.
 
         mock_repo.get_contents.return_value = [mock_file]
 
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Test analysis
-        try:
-            analyzer = RepositoryAnalyzer("test_token")
-            result = analyzer.analyze_repository("https://github.com/user/repo")
-
-            # Verify structure
-            assert 'repository' in result
-            assert 'metadata' in result
-            assert 'file_structure' in result
-            assert 'patterns' in result
-            assert 'workflows' in result
-            assert 'documentation' in result
-
-            # Verify metadata
-            assert result['metadata']['name'] == "test-repo"
-            assert result['metadata']['language'] == "Python"
-            assert result['metadata']['stars'] == 42
-        except Exception as e:
-            print(f"Mock repository analysis error: {e}")
-            # For now, don't fail the test
-            assert True
+        with patch('src.repository_analyzer.Github') as mock_github:
+            mock_github.return_value.get_repo.return_value = mock_repo
+
+            # Test analysis
+            try:
+                analyzer = RepositoryAnalyzer("test_token")
+                result = analyzer.analyze_repository("https://github.com/user/repo")
+
+                # Verify structure
+                assert 'repository' in result
+                assert 'metadata' in result
+                assert 'file_structure' in result
+                assert 'patterns' in result
+                assert 'workflows' in result
+                assert 'documentation' in result
+
+                # Verify metadata
+                assert result['metadata']['name'] == "test-repo"
+                assert result['metadata']['language'] == "Python"
+                assert result['metadata']['stars'] == 42
+            except Exception as e:
+                print(f"Mock repository analysis error: {e}")
+                # For now, don't fail the test
+                assert True
 
     def test_error_handling(self):
         """Test error handling for various edge cases"""
         print("\n🧪 Testing Error Handling...")
 
-        analyzer = RepositoryAnalyzer()
-
         # Test invalid URL
         try:
-            result = analyzer._extract_repo_path("invalid-url")
+            result = self.analyzer._extract_repo_path("invalid-url")
             assert result is None  # Should return None, not raise exception
         except Exception as e:
             print(f"URL extraction error: {e}")
 
         # Test invalid Python code
         try:
-            patterns = analyzer._analyze_python_patterns("invalid python code", "test.py")
+            patterns = self.analyzer._analyze_python_patterns("invalid python code", "test.py")
             assert len(patterns) >= 0  # Should handle gracefully
         except Exception as e:
             print(f"Python pattern error handling: {e}")
@@ -342,7 +387,7 @@ This project is licensed under the MIT License.
 
         # Test None handling for README
         try:
-            result = analyzer._analyze_readme_structure(None)
+            result = self.analyzer._analyze_readme_structure(None)
             assert result is None
         except Exception as e:
             print(f"README None handling: {e}")
@@ -362,9 +407,11 @@ This project is licensed under the MIT License.
             ("Configuration File Detection", self.test_config_file_detection),
             ("Entry Point Detection", self.test_entry_point_detection),
             ("Python Pattern Extraction", self.test_python_pattern_extraction),
+            ("Python Async Pattern Extraction", self.test_python_async_pattern_extraction),
             ("JavaScript Pattern Extraction", self.test_javascript_pattern_extraction),
             ("Workflow Analysis", self.test_workflow_analysis),
             ("README Structure Analysis", self.test_readme_structure_analysis),
+            ("README Code Fence Handling", self.test_readme_structure_skips_code_fences),
             ("Context Compression Simulation", self.test_context_compression_simulation),
             ("Mock Repository Analysis", self.test_mock_repository_analysis),
             ("Error Handling", self.test_error_handling),
@@ -394,6 +441,8 @@ This project is licensed under the MIT License.
 
 
 if __name__ == "__main__":
+    TestRepositoryAnalyzer.setup_class()
     test_suite = TestRepositoryAnalyzer()
+    test_suite.setup_method()
     success = test_suite.run_all_tests()
     sys.exit(0 if success else 1)
@@ -5,7 +5,7 @@ Tests authentication, key management, and security-critical components
 """
 
 import os
-import subprocess
+import re
 import sys
 import tempfile
 from pathlib import Path
@@ -14,6 +14,58 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Patterns for hardcoded secrets, keyed by the name reported on a hit. They are
+# pure ASCII, so files are scanned as raw bytes without decoding them first
+_SECRET_PATTERNS = {
+    'password': rb'password\s*=\s*["\'][^"\']+["\']',
+    'api_key': rb'api_key\s*=\s*["\'][^"\']+["\']',
+    'secret': rb'secret\s*=\s*["\'][^"\']+["\']',
+    'token': rb'token\s*=\s*["\'][^"\']+["\']',
+    'github_pat': rb'ghp_[a-zA-Z0-9]{36}',  # GitHub PAT pattern
+    'sk_key': rb'sk-[a-zA-Z0-9_-]{43,}',  # OpenAI/Anthropic key pattern
+}
+
+# One alternation so each file is scanned in a single pass; lastgroup names the arm
+_SECRET_RE = re.compile(
+    b'|'.join(
+        b'(?P<%s>%s)' % (name.encode(), pattern) for name, pattern in _SECRET_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
+def _scan_file(path):
+    """Return (file name, pattern name) for each secret pattern found in path"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    # Report each pattern once per file, in first-seen order
+    hits = dict.fromkeys(m.lastgroup for m in _SECRET_RE.finditer(content))
+    file_name = os.path.basename(path)
+    return [(file_name, name) for name in hits]
+
+
+def _walk_py(root):
+    """Yield paths of .py files under root, using os.scandir's cached entry types"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    yield entry.path
+
+
+def _script_modes(directory):
+    """Map each .sh file in directory to its st_mode, from a single os.scandir pass"""
+    if not os.path.isdir(directory):
+        return {}
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry.stat().st_mode
+            for entry in entries
+            if entry.name.endswith('.sh') and entry.is_file()
+        }
+
 
 class TestSecurityCritical:
     """Test suite for security-critical components"""
@@ -66,36 +118,20 @@ class TestSecurityCritical:
 
     def test_no_hardcoded_secrets_in_source(self):
         """Test that no hardcoded secrets exist in source files"""
-        import re
-
-        # Patterns to search for
-        secret_patterns = [
-            r'password\s*=\s*["\'][^"\']+["\']',
-            r'api_key\s*=\s*["\'][^"\']+["\']',
-            r'secret\s*=\s*["\'][^"\']+["\']',
-            r'token\s*=\s*["\'][^"\']+["\']',
-            r'ghp_[a-zA-Z0-9]{36}',  # GitHub PAT pattern
-            r'sk-[a-zA-Z0-9_-]{43,}',  # OpenAI/Anthropic key pattern
-        ]
-
         issues_found = []
 
         # Scan source files
-        src_dir = project_root / 'src'
-        for py_file in src_dir.glob('**/*.py'):
-            with open(py_file, encoding='utf-8') as f:
-                content = f.read()
-                for pattern in secret_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        issues_found.append(f"{py_file.name}: {pattern} - {len(matches)} matches")
+        for py_file in _walk_py(project_root / 'src'):
+            issues_found.extend(
+                f"{file_name}: {name}" for file_name, name in _scan_file(py_file)
+            )
 
         # Scan auth.py specifically
         auth_file = project_root / 'auth.py'
         if auth_file.exists():
-            with open(auth_file, encoding='utf-8') as f:
+            with open(auth_file, 'rb') as f:
                 content = f.read()
-                if 'admin' in content and 'password' in content:
+                if b'admin' in content and b'password' in content:
                     issues_found.append("auth.py: Contains hardcoded admin credentials")
 
         if issues_found:
@@ -106,23 +142,17 @@ class TestSecurityCritical:
 
     def test_shell_script_permissions(self):
         """Test that shell scripts have appropriate permissions"""
-        bin_dir = project_root / 'bin'
-        scripts_dir = project_root / 'scripts'
-
         permission_issues = []
 
-        for script_dir in [bin_dir, scripts_dir]:
-            if script_dir.exists():
-                for script_file in script_dir.glob('*.sh'):
-                    if script_file.is_file():
-                        # Check if executable
-                        if not os.access(script_file, os.X_OK):
-                            permission_issues.append(f"{script_file.name} is not executable")
+        for script_dir in ('bin', 'scripts'):
+            for name, mode in _script_modes(project_root / script_dir).items():
+                # Check if executable
+                if not mode & 0o111:
+                    permission_issues.append(f"{name} is not executable")
 
-                        # Check permissions (should not be world-writable)
-                        stat_info = script_file.stat()
-                        if stat_info.st_mode & 0o002:  # World-writable
-                            permission_issues.append(f"{script_file.name} is world-writable")
+                # Check permissions (should not be world-writable)
+                if mode & 0o002:  # World-writable
+                    permission_issues.append(f"{name} is world-writable")
 
         if permission_issues:
             self.test_results.append(f"✗ Permission issues: {permission_issues}")
@@ -162,12 +192,16 @@ class TestSecurityCritical:
 
         missing_scripts = []
         non_executable = []
+        modes = {}
 
         for script_path in critical_scripts:
-            full_path = project_root / script_path
-            if not full_path.exists():
+            script_dir, name = script_path.split('/')
+            if script_dir not in modes:
+                modes[script_dir] = _script_modes(project_root / script_dir)
+            mode = modes[script_dir].get(name)
+            if mode is None:
                 missing_scripts.append(script_path)
-            elif not os.access(full_path, os.X_OK):
+            elif not mode & 0o111:
                 non_executable.append(script_path)
 
         if missing_scripts:
@@ -184,23 +218,32 @@ class TestSecurityCritical:
         """Test that security audit script can run"""
         security_script = project_root / 'bin' / 'security_audit.sh'
 
-        if security_script.exists():
-            try:
-                # Run with --help or similar to test basic functionality
-                subprocess.run(
-                    [str(security_script), '--help'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                # Script should exit cleanly (even if help is not supported)
-                self.test_results.append("✓ Security audit script is executable")
-            except subprocess.TimeoutExpired:
-                self.test_results.append("⚠️ Security audit script timed out (might be normal)")
-            except Exception as e:
-                self.test_results.append(f"✗ Security audit script error: {e}")
-        else:
+        # Don't fork at all when there is nothing runnable
+        if not security_script.exists():
             self.test_results.append("⚠️ Security audit script not found")
+            return
+        if not os.access(security_script, os.X_OK):
+            self.test_results.append("⚠️ Security audit script not executable")
+            return
+
+        import subprocess
+
+        try:
+            # Run with --help or similar to test basic functionality. Output is never
+            # read, so it stays as bytes; no stdin means a prompt can't block until timeout
+            subprocess.run(
+                [str(security_script), '--help'],
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+                timeout=10
+            )
+            # Script should exit cleanly (even if help is not supported)
+            self.test_results.append("✓ Security audit script is executable")
+        except subprocess.TimeoutExpired:
+            self.test_results.append("⚠️ Security audit script timed out (might be normal)")
+        except Exception as e:
+            self.test_results.append(f"✗ Security audit script error: {e}")
 
     def test_results_summary(self):
         """Print test results summary"""
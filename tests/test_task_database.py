@@ -384,3 +384,58 @@ class TestTaskDatabase:
         assert retrieved.context == context
         assert retrieved.context["metadata"]["automated"] is True
         assert retrieved.context["components"] == ["api", "database", "ui"]
+
+    def test_in_memory_database(self):
+        """Test that ':memory:' keeps data across calls without a file."""
+        database = TaskDatabase(":memory:")
+
+        task = Task(id="mem1", title="In Memory")
+        database.create_task(task)
+
+        assert database.get_task("mem1").title == "In Memory"
+        assert database.get_stats()['total_tasks'] == 1
+        assert not Path(":memory:").exists()
+
+    def test_create_tasks_bulk(self, temp_db):
+        """Test creating several tasks, including dependencies, in one call."""
+        tasks = [
+            Task(id="bulk1", title="Bulk 1"),
+            Task(id="bulk2", title="Bulk 2", depends_on=["bulk1", "bulk3"]),
+            Task(id="bulk3", title="Bulk 3", status=TaskStatus.DONE),
+        ]
+
+        created = temp_db.create_tasks_bulk(tasks)
+
+        assert created == tasks
+        assert temp_db.get_stats()['total_tasks'] == 3
+        # Forward references resolve because rows are inserted first
+        assert set(temp_db.get_task("bulk2").depends_on) == {"bulk1", "bulk3"}
+
+    def test_in_memory_list_tasks_cache(self):
+        """Test that cached list_tasks results are dropped on writes."""
+        database = TaskDatabase(":memory:")
+        database.create_task(Task(id="cache1", title="Cached"))
+
+        first = database.list_tasks()
+        assert [t.id for t in database.list_tasks()] == [t.id for t in first]
+
+        database.create_task(Task(id="cache2", title="Added"))
+        assert {t.id for t in database.list_tasks()} == {"cache1", "cache2"}
+
+        database.delete_task("cache1")
+        assert [t.id for t in database.list_tasks()] == ["cache2"]
+
+    def test_in_memory_list_tasks_cache_returns_copies(self):
+        """Test that mutating a listed task does not leak into later listings."""
+        database = TaskDatabase(":memory:")
+        database.create_task(Task(id="copy1", title="Original", tags=["a"]))
+
+        listed = database.list_tasks()[0]
+        listed.title = "Changed"
+        listed.tags.append("b")
+        listed.context["key"] = "value"
+
+        again = database.list_tasks()[0]
+        assert again.title == "Original"
+        assert again.tags == ["a"]
+        assert again.context == {}
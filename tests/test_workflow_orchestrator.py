@@ -152,6 +152,7 @@ class TestWorkflowOrchestrator:
             "name": "${project_name}",
             "version": "${version}",
             "output": "${previous_output}",
+            "label": "${project_name}-v${version}",
             "timeout": 30,
             "nested": {
                 "project": "${project_name}"
@@ -163,6 +164,7 @@ class TestWorkflowOrchestrator:
         assert resolved["name"] == "my-app"
         assert resolved["version"] == "1.0"
         assert resolved["output"] == "some_value"
+        assert resolved["label"] == "my-app-v1.0"
         assert resolved["timeout"] == 30
         assert resolved["nested"]["project"] == "my-app"
 